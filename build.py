@@ -5,13 +5,42 @@ Sets up the Python virtual environment, installs dependencies via uv,
 and builds the gerrit_mcp_server package.
 """
 
+import argparse
 import hashlib
+import logging
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 VENV_DIR = ".venv"
-REQUIREMENTS_FILE = "requirements.txt"
+LOCK_FILE = "uv.lock"
+UV_REQUIREMENTS_FILE = "uv-requirements.txt"
+PACKAGE_DIR = Path("gerrit_mcp_server")
+BUILD_STAMP = Path(VENV_DIR) / ".build-stamp"
+INSTALLED_WHEEL_STAMP = Path(VENV_DIR) / ".installed.sha256"
+
+# A stable uv cache location so CI systems can persist it between runs.
+UV_CACHE_DIR = Path(os.environ.get("UV_CACHE_DIR") or Path.home() / ".cache" / "uv")
+
+# Environment shared by every uv invocation. Packages are linked from the uv
+# cache with uv's per-platform default (hardlinks on Linux, clones on macOS),
+# bytecode is compiled at install time instead of on the server's first import,
+# and the progress renderer is disabled since its output is piped, not shown on
+# a tty.
+# UV_PYTHON pins the interpreter running this script so uv skips discovery, and
+# a fixed SOURCE_DATE_EPOCH makes rebuilding unchanged sources produce a
+# byte-identical wheel, so an already installed wheel can be recognized.
+UV_ENV = os.environ | {
+    "SOURCE_DATE_EPOCH": os.environ.get("SOURCE_DATE_EPOCH", "315532800"),
+    "UV_CACHE_DIR": str(UV_CACHE_DIR),
+    "UV_PYTHON": sys.executable,
+    "UV_NO_PROGRESS": "1",
+    "UV_COMPILE_BYTECODE": "1",
+}
 
 # --- Color helpers (ANSI codes work on modern Windows terminals too) ---
 GREEN = "\033[0;32m"
@@ -19,6 +48,8 @@ YELLOW = "\033[1;33m"
 RED = "\033[0;31m"
 NC = "\033[0m"
 
+log = logging.getLogger("build")
+
 
 def venv_executable(name: str) -> Path:
     """Return path to an executable inside the venv, platform-aware."""
@@ -28,83 +59,200 @@ def venv_executable(name: str) -> Path:
 
 
 def run(args: list[str], **kwargs) -> subprocess.CompletedProcess:
-    """Run a subprocess, raising on failure."""
-    return subprocess.run(args, check=True, **kwargs)
+    """Run a subprocess with the shared uv environment, raising on failure.
 
+    The child's stdout and stderr are relayed line by line while it runs, so
+    its output is visible as it happens and a full pipe never stalls it.
+    """
+    kwargs.setdefault("env", UV_ENV)
+    with subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        **kwargs,
+    ) as process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args)
+    return subprocess.CompletedProcess(args, process.returncode)
 
-def build():
-    print(f"\n{YELLOW}Setting up the Python environment for the Gerrit MCP server...{NC}")
 
-    # Create a build directory to indicate the server is "installed"
-    Path("build").mkdir(exist_ok=True)
+def build_fingerprint() -> str:
+    """Return a digest of every input that affects the installed environment."""
+    inputs = [Path("pyproject.toml"), Path(LOCK_FILE), Path(UV_REQUIREMENTS_FILE)]
+    inputs += sorted(
+        path for path in PACKAGE_DIR.rglob("*") if "__pycache__" not in path.parts
+    )
+    digest = hashlib.sha256()
+    for path in inputs:
+        if path.is_file():
+            digest.update(path.as_posix().encode() + b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
 
-    # Create a virtual environment
-    print(f"Creating virtual environment in {VENV_DIR}...")
-    try:
-        run([sys.executable, "-m", "venv", VENV_DIR])
-    except subprocess.CalledProcessError:
-        print(f"{RED}Failed to create virtual environment.{NC}")
-        sys.exit(1)
 
-    pip = str(venv_executable("pip"))
-    uv = str(venv_executable("uv"))
+def sha256_file(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file, streaming it from disk."""
+    with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+        return digest.hexdigest()
 
-    # Install uv into the virtual environment
-    print("Installing uv...")
-    try:
-        run([pip, "install", "-r", "uv-requirements.txt", "--require-hashes"])
-    except subprocess.CalledProcessError:
-        print(f"{RED}Failed to install uv.{NC}")
-        sys.exit(1)
 
-    # Use uv to compile dependencies into a requirements.txt file with hashes
-    print("Compiling dependencies and generating hashes...")
-    try:
-        run([
-            uv, "pip", "compile", "pyproject.toml",
-            "--generate-hashes",
-            "--output-file", REQUIREMENTS_FILE,
-            "--extra", "dev",
-            "--extra-index-url", "https://pypi.org/simple",
-        ])
-    except subprocess.CalledProcessError:
-        print(f"\n{RED}Failed to compile dependencies.{NC}")
-        sys.exit(1)
-
-    # Use uv to install dependencies from the requirements.txt file
-    print(f"Installing dependencies from {REQUIREMENTS_FILE}...")
-    try:
-        run([uv, "pip", "sync", REQUIREMENTS_FILE])
-    except subprocess.CalledProcessError:
-        print(f"\n{RED}Failed to set up the Python environment.{NC}")
-        sys.exit(1)
+def write_atomic(path: Path, text: str):
+    """Write text to path through a temporary file and os.replace."""
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as tmp:
+        tmp.write(text)
+    os.replace(tmp.name, path)
+
 
-    # Build the gerrit_mcp_server package
-    print("Building and installing the gerrit_mcp_server package...")
+def newest_wheel() -> Path | None:
+    """Return the most recently built wheel in dist/, or None if there is none."""
     try:
-        run([uv, "build"])
-    except subprocess.CalledProcessError:
-        print(f"\n{RED}Failed to build the gerrit_mcp_server package.{NC}")
-        sys.exit(1)
+        with os.scandir("dist") as entries:
+            wheels = [entry for entry in entries if entry.name.endswith(".whl")]
+    except FileNotFoundError:
+        return None
+    if not wheels:
+        return None
+    return Path(max(wheels, key=lambda entry: entry.stat().st_mtime).path)
+
+
+def find_uv() -> str | None:
+    """Return the path to an existing uv binary, if any.
 
-    # Find the wheel, compute its hash, and install with hash verification
-    wheel_file = next(Path("dist").glob("*.whl"))
-    wheel_hash = hashlib.sha256(wheel_file.read_bytes()).hexdigest()
+    Looks on PATH first, then at the pinned uv that 'uv sync' installs into
+    the venv from the dev extra.
+    """
+    uv = shutil.which("uv")
+    if uv:
+        return uv
+    candidate = venv_executable("uv")
+    if candidate.exists():
+        return str(candidate)
+    return None
 
-    local_req = Path("local-requirements.txt")
-    local_req.write_text(f"{wheel_file} --hash=sha256:{wheel_hash}\n")
 
+def install_uv() -> str:
+    """Bootstrap the pinned uv into the venv with a hash-checked pip install.
+
+    pip verifies the download against the hashes in uv-requirements.txt. The
+    venv is the one 'uv sync' adopts afterwards, and the dev extra pins the
+    same uv, so the sync keeps it.
+    """
+    run([sys.executable, "-m", "venv", VENV_DIR])
+    run([
+        str(venv_executable("python")), "-m", "pip", "install", "--quiet",
+        "-r", UV_REQUIREMENTS_FILE, "--require-hashes",
+    ])
+    uv = venv_executable("uv")
+    if not uv.exists():
+        raise FileNotFoundError(f"uv was not installed into {VENV_DIR}.")
+    return str(uv)
+
+
+def build():
+    log.info(f"\n{YELLOW}Setting up the Python environment for the Gerrit MCP server...{NC}")
+
+    # Skip the whole build when nothing has changed since the last one
+    fingerprint = build_fingerprint()
+    if (
+        BUILD_STAMP.exists()
+        and BUILD_STAMP.read_text() == fingerprint
+        and newest_wheel() is not None
+    ):
+        log.info(f"{GREEN}The Gerrit MCP server environment is up-to-date.{NC}")
+        return
+
+    # Use the uv already on PATH, or bootstrap the pinned version
+    uv = find_uv()
+    if uv is None:
+        log.info("Installing uv...")
+        try:
+            uv = install_uv()
+        except (OSError, subprocess.CalledProcessError) as e:
+            log.error(f"{RED}Failed to install uv: {e}{NC}")
+            sys.exit(1)
+
+    # 'uv sync' creates the virtual environment itself from the interpreter
+    # running this script, so no separate 'uv venv' process is needed. It
+    # verifies every downloaded package against the hashes in uv.lock, which
+    # is where hash checking belongs; the locally built wheel is not rehashed.
+    # Installing the locked dependencies and building the wheel do not depend
+    # on each other, so run them concurrently. uv's cache is safe to share
+    # between the two; --quiet keeps their output from interleaving. uv.lock
+    # marks the project as virtual, so an exact sync would uninstall the wheel
+    # installed below; --inexact leaves it in place for the hash check.
+    log.info(f"Installing dependencies from {LOCK_FILE} and building the gerrit_mcp_server package...")
+    phases = [
+        ([uv, "sync", "--extra", "dev", "--frozen", "--inexact", "--quiet"],
+         "Failed to set up the Python environment."),
+        ([uv, "build", "--quiet"],
+         "Failed to build the gerrit_mcp_server package."),
+    ]
+    with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+        futures = [(executor.submit(run, args), message) for args, message in phases]
+        wait([future for future, _ in futures], return_when=ALL_COMPLETED)
+
+    for future, message in futures:
+        try:
+            future.result()
+        except subprocess.CalledProcessError:
+            log.error(f"\n{RED}{message}{NC}")
+            sys.exit(1)
+
+    # The wheel was built by this run, so install it directly; there is no
+    # external download to protect with hash verification. Pick the newest
+    # wheel so a stale one left in dist/ by an older build is never installed.
+    wheel_file = newest_wheel()
+    wheel_hash = sha256_file(wheel_file)
     try:
-        run([uv, "pip", "install", "-r", str(local_req), "--no-deps", "--require-hashes"])
-    except subprocess.CalledProcessError:
-        print(f"\n{RED}Failed to install the gerrit_mcp_server package.{NC}")
-        local_req.unlink(missing_ok=True)
-        sys.exit(1)
+        installed_hash = INSTALLED_WHEEL_STAMP.read_text().strip()
+    except OSError:
+        installed_hash = None
+
+    # The console script is checked too, so a venv whose package went missing
+    # behind an up-to-date stamp is repaired rather than trusted.
+    if installed_hash == wheel_hash and venv_executable("gerrit-mcp-server").exists():
+        log.info("The gerrit_mcp_server wheel is already installed.")
+    else:
+        # Every build produces the same version, so refresh the package to
+        # keep uv from reusing cached metadata for the previous wheel. The
+        # venv's interpreter is passed explicitly since UV_PYTHON names the
+        # base one.
+        log.info("Installing the gerrit_mcp_server package...")
+        try:
+            run([
+                uv, "pip", "install", "--no-deps",
+                *([] if log.isEnabledFor(logging.INFO) else ["--quiet"]),
+                "--python", str(venv_executable("python")),
+                "--refresh-package", "gerrit-mcp-server",
+                str(wheel_file),
+            ])
+        except subprocess.CalledProcessError:
+            log.error(f"\n{RED}Failed to install the gerrit_mcp_server package.{NC}")
+            sys.exit(1)
+        write_atomic(INSTALLED_WHEEL_STAMP, wheel_hash)
 
-    local_req.unlink(missing_ok=True)
+    write_atomic(BUILD_STAMP, fingerprint)
 
-    print(f"\n{GREEN}Successfully set up the Gerrit MCP server environment.{NC}")
+    log.info(f"\n{GREEN}Successfully set up the Gerrit MCP server environment.{NC}")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Set up the Gerrit MCP server environment.")
+    parser.add_argument(
+        "--quiet", action="store_true", help="Only report errors from this script."
+    )
+    cli_args = parser.parse_args()
+    logging.basicConfig(stream=sys.stdout, format="%(message)s", level=logging.INFO)
+    if cli_args.quiet:
+        log.setLevel(logging.WARNING)
     build()
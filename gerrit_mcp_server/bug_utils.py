@@ -16,6 +16,18 @@ import re
 from typing import Set
 
 
+# Lines starting with Bug, Fixes, or Closes; captures the rest of the line.
+_FOOTER_RE = re.compile(
+    r"^\s*(?:Bug|Fixes|Closes)\s*:\s*(.*)", re.MULTILINE | re.IGNORECASE
+)
+# Common separators between IDs on a footer line, like comma or space.
+_ID_SEPARATOR_RE = re.compile(r"[\s,]+")
+# Bug IDs that are optionally prefixed with 'b/'.
+_BUG_ID_RE = re.compile(r"(?:b/)?(\d+)")
+# Inline bug mentions, e.g., "This fixes b/12345".
+_INLINE_BUG_RE = re.compile(r"\bb/(\d+)\b", re.IGNORECASE)
+
+
 def extract_bugs_from_commit_message(commit_message: str) -> Set[str]:
     """
     Extracts bug IDs from a commit message.
@@ -28,28 +40,12 @@ def extract_bugs_from_commit_message(commit_message: str) -> Set[str]:
     """
     bug_ids = set()
 
-    # Pattern for lines starting with Bug, Fixes, or Closes.
-    # This captures the rest of the line.
-    footer_pattern = r"^\s*(?:Bug|Fixes|Closes)\s*:\s*(.*)"
-    footer_matches = re.findall(
-        footer_pattern, commit_message, re.MULTILINE | re.IGNORECASE
-    )
-
-    for line in footer_matches:
-        # Split the line by common separators like comma or space.
-        potential_ids = re.split(r"[\s,]+", line)
-        for pid in potential_ids:
-            if not pid:
-                continue
-            # Match bug IDs that are optionally prefixed with 'b/'.
-            bug_id_match = re.fullmatch(r"(?:b/)?(\d+)", pid)
+    for line in _FOOTER_RE.findall(commit_message):
+        for pid in _ID_SEPARATOR_RE.split(line):
+            bug_id_match = _BUG_ID_RE.fullmatch(pid)
             if bug_id_match:
                 bug_ids.add(bug_id_match.group(1))
 
-    # Pattern for inline bug mentions, e.g., "This fixes b/12345".
-    inline_pattern = r"\bb/(\d+)\b"
-    inline_matches = re.findall(inline_pattern, commit_message, re.IGNORECASE)
-    for mid in inline_matches:
-        bug_ids.add(mid)
+    bug_ids.update(_INLINE_BUG_RE.findall(commit_message))
 
-    return bug_ids
\ No newline at end of file
+    return bug_ids
@@ -13,19 +13,28 @@
 # limitations under the License.
 
 import asyncio
+import atexit
+import contextlib
+import functools
 import json
+import logging
+import logging.handlers
+import queue
 import sys
 import base64
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from urllib.parse import quote
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlencode
 import os
 import datetime  # Added this import
 import argparse
 
+import httpx
+
+from gerrit_mcp_server import json_utils
 from gerrit_mcp_server.gerrit_urls import get_curl_command_for_gerrit_url
 from gerrit_mcp_server.bug_utils import extract_bugs_from_commit_message
-from gerrit_mcp_server.sort_util import sort_changes_by_date
 from mcp.server.fastmcp import FastMCP
 import mcp.types as types
 
@@ -36,9 +45,29 @@ SERVER_ROOT_PATH = PKG_PATH.parent
 LOG_FILE_PATH = SERVER_ROOT_PATH / "server.log"
 CONFIG_FILE_PATH = PKG_PATH / "gerrit_config.json"
 
+# A single long-lived handler appends to server.log, so logging a request
+# does not reopen the file. The file is only created on the first record.
+# Records are handed to a background thread through a queue, so the event
+# loop never blocks on the file write.
+logger = logging.getLogger("gerrit_mcp")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_handler = logging.FileHandler(LOG_FILE_PATH, encoding="utf-8", delay=True)
+_log_handler.setFormatter(logging.Formatter("[gerrit-mcp-server] %(message)s"))
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 
 def load_gerrit_config() -> Dict[str, Any]:
-    """Loads the Gerrit configuration from the JSON file."""
+    """Loads the Gerrit configuration from the JSON file.
+
+    The parsed configuration is cached per file and modification time, so
+    repeated calls only stat the file and an edited file is picked up on the
+    next call.
+    """
     config_path_str = os.environ.get("GERRIT_CONFIG_PATH")
     if config_path_str:
         config_path = Path(config_path_str)
@@ -53,37 +82,36 @@ def load_gerrit_config() -> Dict[str, Any]:
             "'gerrit_mcp_server/gerrit_config.json' as a starting point. "
             "Refer to the README.md for more details on the configuration options."
         )
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        # Without a modification time there is nothing to key the cache on.
+        return _read_gerrit_config(config_path)
+    return _load_gerrit_config_cached(config_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_gerrit_config_cached(config_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Returns the parsed configuration for a given version of the file."""
+    return _read_gerrit_config(config_path)
+
+
+def _read_gerrit_config(config_path: Path) -> Dict[str, Any]:
+    """Reads, parses and validates the configuration file at config_path."""
     try:
         with open(config_path, "r", encoding="utf-8") as f:
             config = json.load(f)
             default_url = config.get("default_gerrit_base_url")
             if default_url:
-                normalized_default = _normalize_gerrit_url(
-                    default_url, config.get("gerrit_hosts", [])
-                )
-                found_match = False
-                for host in config.get("gerrit_hosts", []):
-                    external_url = host.get("external_url")
-                    internal_url = host.get("internal_url")
-                    if (
-                        external_url
-                        and _normalize_gerrit_url(
-                            external_url, config.get("gerrit_hosts", [])
-                        )
-                        == normalized_default
-                    ):
-                        found_match = True
-                        break
-                    if (
-                        internal_url
-                        and _normalize_gerrit_url(
-                            internal_url, config.get("gerrit_hosts", [])
-                        )
-                        == normalized_default
-                    ):
-                        found_match = True
-                        break
-                if not found_match:
+                gerrit_hosts = config.get("gerrit_hosts", [])
+                normalized_default = _normalize_gerrit_url(default_url, gerrit_hosts)
+                known_urls = {
+                    _normalize_gerrit_url(url, gerrit_hosts)
+                    for host in gerrit_hosts
+                    for url in (host.get("external_url"), host.get("internal_url"))
+                    if url
+                }
+                if normalized_default not in known_urls:
                     raise ValueError(
                         f"The default_gerrit_base_url '{default_url}' (normalized to '{normalized_default}') "
                         "does not match any 'external_url' or 'internal_url' in the 'gerrit_hosts' array. "
@@ -98,35 +126,33 @@ def load_gerrit_config() -> Dict[str, Any]:
         raise e
 
 
-try:
-    with open(PKG_PATH / "gerrit_details.json", "r", encoding="utf-8") as f:
-        gerrit_details = json.load(f)
-    # This file is not used in this implementation, but kept for pattern consistency
-    with open(
-        PKG_PATH / "gerrit_command_argument_defs.json", "r", encoding="utf-8"
-    ) as f:
-        gerrit_arg_defs = json.load(f)
-except Exception as e:
-    print(
-        f"[gerrit-mcp-server-error] Failed to load or parse JSON files: {e}. Using default descriptions.",
-        file=sys.stderr,
-    )
-    gerrit_details = {
-        "toolOverallDescription": "A tool to interact with Gerrit code review systems using curl."
-    }
+@functools.cache
+def _get_gerrit_details() -> Dict[str, Any]:
+    """Returns the parsed gerrit_details.json, read on first use."""
+    try:
+        return json_utils.loads((PKG_PATH / "gerrit_details.json").read_bytes())
+    except Exception as e:
+        print(
+            f"[gerrit-mcp-server-error] Failed to load or parse gerrit_details.json: {e}. Using default descriptions.",
+            file=sys.stderr,
+        )
+        return {
+            "toolOverallDescription": "A tool to interact with Gerrit code review systems using curl."
+        }
 
-# --- Initialize FastMCP Server ---
-mcp = FastMCP("gerrit")
 
 # --- Session State ---
 
 
-def _get_gerrit_base_url(gerrit_base_url: Optional[str] = None) -> str:
+def _get_gerrit_base_url(
+    gerrit_base_url: Optional[str] = None, config: Optional[Dict[str, Any]] = None
+) -> str:
     """Returns the Gerrit base URL, prioritizing the parameter over the environment variable."""
     if gerrit_base_url:
         return gerrit_base_url
 
-    config = load_gerrit_config()
+    if config is None:
+        config = load_gerrit_config()
     return os.environ.get(
         "GERRIT_BASE_URL",
         config.get(
@@ -135,8 +161,31 @@ def _get_gerrit_base_url(gerrit_base_url: Optional[str] = None) -> str:
     )
 
 
+def _resolve_base_url(gerrit_base_url: Optional[str] = None) -> str:
+    """Returns the normalized Gerrit base URL for a tool call.
+
+    The configuration is loaded once and shared between picking the base URL
+    and normalizing it against the configured hosts.
+    """
+    config = load_gerrit_config()
+    return _normalize_gerrit_url(
+        _get_gerrit_base_url(gerrit_base_url, config), config.get("gerrit_hosts", [])
+    )
+
+
 def _normalize_gerrit_url(url: str, gerrit_hosts: List[Dict[str, Any]]) -> str:
     """Normalizes a Gerrit URL based on the mappings in the provided gerrit_hosts."""
+    host_urls = tuple(
+        (host.get("internal_url"), host.get("external_url")) for host in gerrit_hosts
+    )
+    return _normalize_gerrit_url_cached(url, host_urls)
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_gerrit_url_cached(
+    url: str, host_urls: Tuple[Tuple[Optional[str], Optional[str]], ...]
+) -> str:
+    """Normalizes url against (internal_url, external_url) pairs; memoized."""
 
     # Store the original URL for explicit internal URL matching
     original_url = url.rstrip("/")
@@ -144,10 +193,7 @@ def _normalize_gerrit_url(url: str, gerrit_hosts: List[Dict[str, Any]]) -> str:
 
     normalized_url = url  # Default to original if no match found
 
-    for host in gerrit_hosts:
-        internal_url = host.get("internal_url")
-        external_url = host.get("external_url")
-
+    for internal_url, external_url in host_urls:
         stripped_internal = (
             internal_url.replace("https://", "").replace("http://", "").rstrip("/")
             if internal_url
@@ -171,22 +217,92 @@ def _normalize_gerrit_url(url: str, gerrit_hosts: List[Dict[str, Any]]) -> str:
             break  # Found a match, so we can exit the loop.
 
     # Ensure https, then strip trailing slash
-    if not (
-        normalized_url.startswith("http://") or normalized_url.startswith("https://")
-    ):
+    if not normalized_url.startswith("https://"):
+        if normalized_url.startswith("http://"):
+            normalized_url = normalized_url[len("http://") :]
         normalized_url = "https://" + normalized_url
-    elif normalized_url.startswith("http://"):
-        normalized_url = normalized_url.replace("http://", "https://")
 
     return normalized_url.rstrip("/")
 
 
-async def run_curl(args: List[str], gerrit_base_url: str) -> str:
-    """Executes a curl command and returns the output."""
-    config = load_gerrit_config()
-    command = get_curl_command_for_gerrit_url(gerrit_base_url, config) + args
-    with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-        log_file.write(f"[gerrit-mcp-server] Executing: {' '.join(command)}\n")
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Returns the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections to each Gerrit host alive between
+    tool calls instead of paying for a new process and TLS handshake per
+    request. Like curl, it follows redirects; unlike curl, connecting and each
+    read or write give up after 30 seconds.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            timeout=httpx.Timeout(30.0),
+        )
+    return _http_client
+
+
+_http_client_sessions = 0
+
+
+@contextlib.asynccontextmanager
+async def _http_client_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Closes the shared HTTP client once the last server session has ended."""
+    global _http_client, _http_client_sessions
+    _http_client_sessions += 1
+    try:
+        yield
+    finally:
+        _http_client_sessions -= 1
+        if _http_client_sessions == 0 and _http_client is not None:
+            client, _http_client = _http_client, None
+            await client.aclose()
+
+
+def _parse_curl_args(args: List[str]) -> Dict[str, Any]:
+    """Translates the curl options used by this server into request arguments.
+
+    Only the options produced by gerrit_auth and the tool implementations are
+    understood: -X, -H, --data, --user and -b, plus the -s and -L flags which
+    need no translation.
+    """
+    request: Dict[str, Any] = {"method": None, "headers": {}, "content": None}
+    url = None
+    options = iter(args)
+    for arg in options:
+        if arg == "-X":
+            request["method"] = next(options)
+        elif arg == "-H":
+            name, _, value = next(options).partition(":")
+            request["headers"][name.strip()] = value.strip()
+        elif arg == "--data":
+            request["content"] = next(options)
+        elif arg == "--user":
+            username, _, password = next(options).partition(":")
+            request["auth"] = (username, password)
+        elif arg == "-b":
+            request["headers"]["Cookie"] = next(options)
+        elif arg in ("-s", "-L"):
+            continue
+        elif arg.startswith("-"):
+            raise ValueError(f"Unsupported curl option: {arg}")
+        else:
+            url = arg
+    if url is None:
+        raise ValueError("No URL given in curl arguments.")
+    if request["method"] is None:
+        request["method"] = "POST" if request["content"] is not None else "GET"
+    request["url"] = url
+    return request
+
+
+async def _run_curl_process(command: List[str]) -> bytes:
+    """Runs a curl-compatible command in a subprocess and returns its stdout."""
+    logger.info("Executing: %s", " ".join(command))
 
     process = await asyncio.create_subprocess_exec(
         *command,
@@ -194,51 +310,96 @@ async def run_curl(args: List[str], gerrit_base_url: str) -> str:
         stderr=asyncio.subprocess.PIPE,
     )
     stdout, stderr = await process.communicate()
-
-    stdout_str = stdout.decode("utf-8")
     stderr_str = stderr.decode("utf-8")
 
-    with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-        log_file.write("[gerrit-mcp-server] curl command finished.\n")
-        log_file.write(f"[gerrit-mcp-server] stdout:\n{stdout_str}\n")
-        log_file.write(f"[gerrit-mcp-server] stderr:\n{stderr_str}\n")
+    # The body itself is logged once decoded, by run_curl.
+    logger.info(
+        "curl command finished with %d bytes of output.\n"
+        "[gerrit-mcp-server] stderr:\n%s",
+        len(stdout),
+        stderr_str,
+    )
 
     if process.returncode != 0:
         error_msg = f"curl command failed with exit code {process.returncode}.\nSTDERR:\n{stderr_str}"
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(f"[gerrit-mcp-server] {error_msg}\n")
+        logger.error("%s", error_msg)
         raise Exception(error_msg)
+    return stdout
+
+
+async def _run_http_request(command: List[str]) -> bytes:
+    """Performs the request described by a curl command on the shared client."""
+    request = _parse_curl_args(command[1:])
+    logger.info("Requesting: %s %s", request["method"], request["url"])
+
+    try:
+        response = await _get_http_client().request(**request)
+    except httpx.HTTPError as e:
+        error_msg = f"HTTP request to {request['url']} failed: {e!r}"
+        logger.error("%s", error_msg)
+        raise Exception(error_msg) from e
+
+    logger.info(
+        "Request finished with status %d and %d bytes of output.",
+        response.status_code,
+        len(response.content),
+    )
+    return response.content
+
+
+async def run_curl(args: List[str], gerrit_base_url: str) -> str:
+    """Executes a Gerrit REST request described by curl arguments.
+
+    Hosts authenticated through 'curl' are queried in-process over a shared
+    HTTP connection pool; other tools such as gob-curl are run as a
+    subprocess.
+    """
+    config = load_gerrit_config()
+    command = get_curl_command_for_gerrit_url(gerrit_base_url, config) + args
+    if command[0] == "curl":
+        stdout = await _run_http_request(command)
+    else:
+        stdout = await _run_curl_process(command)
 
     # Gerrit prepends )]\' to JSON responses to prevent XSSI.
-    # We need to remove it before parsing.
-    if stdout_str.startswith(")]}'"):
-        stdout_str = stdout_str[4:]
+    # We need to remove it before parsing. Strip it from the raw bytes so
+    # the body is only decoded once.
+    if stdout.startswith(b")]}'"):
+        stdout = stdout[4:]
+    stdout_str = stdout.decode("utf-8")
 
-    with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-        log_file.write(f"[gerrit-mcp-server] JSON to parse:\n{stdout_str}\n")
+    logger.info("JSON to parse:\n%s", stdout_str)
 
     return stdout_str.strip()
 
 
+# Arguments that mark a curl request body as JSON, built once for all requests.
+_JSON_CONTENT_TYPE_ARGS = ("-H", "Content-Type: application/json")
+
+
 def _create_post_args(url: str, payload: Optional[Dict[str, Any]] = None) -> List[str]:
     """Creates the argument list for a curl POST request."""
-    args = ["-X", "POST"]
-    if payload:
-        payload_json = json.dumps(payload)
-        args.extend(["-H", "Content-Type: application/json", "--data", payload_json])
-    args.append(url)
-    return args
+    if not payload:
+        return ["-X", "POST", url]
+    payload_json = json_utils.dumps(payload)
+    return ["-X", "POST", *_JSON_CONTENT_TYPE_ARGS, "--data", payload_json, url]
 
 
 def _create_put_args(url: str, payload: Optional[Dict[str, Any]] = None) -> List[str]:
     """Creates the argument list for a curl PUT request."""
-    args = ["-X", "PUT"]
-    if payload:
-        payload_json = json.dumps(payload)
-        args.extend(["-H", "Content-Type: application/json", "--data", payload_json])
-    args.append(url)
-    return args
+    if not payload:
+        return ["-X", "PUT", url]
+    payload_json = json_utils.dumps(payload)
+    return ["-X", "PUT", *_JSON_CONTENT_TYPE_ARGS, "--data", payload_json, url]
+
 
+def _text(text: str) -> List[Dict[str, str]]:
+    """Wraps text in the single text-content result every tool returns."""
+    return [{"type": "text", "text": text}]
+
+
+# --- Initialize FastMCP Server ---
+mcp = FastMCP("gerrit", lifespan=_http_client_lifespan)
 
 # --- Tool Implementations ---
 
@@ -253,39 +414,34 @@ async def query_changes(
     """
     Searches for CLs matching a given query string.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
-    url = f"{base_url}/changes/?q={quote(query)}"
+    base_url = _resolve_base_url(gerrit_base_url)
+    # Gerrit accepts ':' unescaped in queries, so operators like status:open
+    # stay readable. '+' must still be escaped, as it would decode to a space.
+    url_parts = [f"{base_url}/changes/?q={quote(query, safe=':/')}"]
     if limit:
-        url += f"&n={limit}"
+        url_parts.append(f"&n={limit}")
     if options:
-        for option in options:
-            url += f"&o={option}"
+        url_parts.extend(f"&o={option}" for option in options)
+    url = "".join(url_parts)
 
     result_json_str = await run_curl([url], base_url)
     try:
-        changes = json.loads(result_json_str)
+        changes = json_utils.loads(result_json_str)
     except json.JSONDecodeError:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to parse JSON response from Gerrit. Raw response: '{result_json_str}'",
-            }
-        ]
-    changes = sort_changes_by_date(changes)
-
+        return _text(
+            f"Failed to parse JSON response from Gerrit. Raw response: '{result_json_str}'"
+        )
+    # Gerrit already returns search results most recently updated first, which
+    # get_most_recent_cl relies on as well, so they are not sorted again here.
     if not changes:
-        return [{"type": "text", "text": f"No changes found for query: {query}"}]
+        return _text(f"No changes found for query: {query}")
 
-    output = f'Found {len(changes)} changes for query "{query}":\n'
+    parts = [f'Found {len(changes)} changes for query "{query}":\n']
     for change in changes:
         wip_prefix = "[WIP] " if change.get("work_in_progress") else ""
-        output += f"- {change['_number']}: {wip_prefix}{change['subject']}\n"
+        parts.append(f"- {change['_number']}: {wip_prefix}{change['subject']}\n")
 
-    return [{"type": "text", "text": output}]
+    return _text("".join(parts))
 
 
 @mcp.tool()
@@ -314,24 +470,22 @@ async def query_changes_by_date_and_filters(  # Renamed method
     """
     # Parse dates and increment end_date by one day for Gerrit's 'before' operator
     try:
-        parsed_start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-        parsed_end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+        parsed_start_date = datetime.date.fromisoformat(start_date)
+        parsed_end_date = datetime.date.fromisoformat(end_date)
     except ValueError:
-        return [
-            {
-                "type": "text",
-                "text": "Invalid date format. Please use YYYY-MM-DD for start_date and end_date.",
-            }
-        ]
+        return _text(
+            "Invalid date format. Please use YYYY-MM-DD for start_date and end_date."
+        )
 
     # Increment the end date by one day to make the 'before' query inclusive of the target end_date
     effective_end_date = parsed_end_date + datetime.timedelta(days=1)
-    effective_end_date_str = effective_end_date.strftime("%Y-%m-%d")
+    effective_end_date_str = effective_end_date.isoformat()
 
-    # Construct the Gerrit query string based on the specialized parameters
+    # Construct the Gerrit query string based on the specialized parameters.
+    # isoformat() always renders the dates as YYYY-MM-DD.
     query_parts = [
         f"status:{status}",
-        f"after:{parsed_start_date.strftime('%Y-%m-%d')}",
+        f"after:{parsed_start_date.isoformat()}",
         f"before:{effective_end_date_str}",  # Use the incremented date here
     ]
     # If a project is specified, add it to the query.
@@ -357,11 +511,7 @@ async def get_change_details(
     """
     Retrieves a comprehensive summary of a single CL.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
 
     # Always get the commit message and other details
     base_options = ["CURRENT_REVISION", "CURRENT_COMMIT", "DETAILED_LABELS"]
@@ -375,12 +525,14 @@ async def get_change_details(
     url = f"{base_url}/changes/{change_id}/detail?{query_params}"
 
     result_json_str = await run_curl([url], base_url)
-    details = json.loads(result_json_str)
+    details = json_utils.loads(result_json_str)
 
-    output = f"Summary for CL {details['_number']}:\n"
-    output += f"Subject: {details['subject']}\n"
-    output += f"Owner: {details['owner']['email']}\n"
-    output += f"Status: {details['status']}\n"
+    parts = [
+        f"Summary for CL {details['_number']}:\n",
+        f"Subject: {details['subject']}\n",
+        f"Owner: {details['owner']['email']}\n",
+        f"Status: {details['status']}\n",
+    ]
 
     # Extract and display bugs from commit message
     if "current_revision" in details and details["current_revision"] in details.get(
@@ -391,33 +543,36 @@ async def get_change_details(
             commit_message = current_rev_info["commit"]["message"]
             bugs = extract_bugs_from_commit_message(commit_message)
             if bugs:
-                output += f"Bugs: {', '.join(sorted(list(bugs)))}\n"
+                parts.append(f"Bugs: {', '.join(sorted(bugs))}\n")
 
     if "reviewers" in details and "REVIEWER" in details["reviewers"]:
-        output += "Reviewers:\n"
+        parts.append("Reviewers:\n")
+        # Index the votes by account once instead of rescanning every label
+        # for each reviewer.
+        votes_by_account: Dict[Any, List[str]] = {}
+        for label, info in details.get("labels", {}).items():
+            for vote in info.get("all", []):
+                vote_value = vote.get("value", 0)
+                vote_str = f"+{vote_value}" if vote_value > 0 else str(vote_value)
+                votes_by_account.setdefault(vote.get("_account_id"), []).append(
+                    f"{label}: {vote_str}"
+                )
         for reviewer in details["reviewers"]["REVIEWER"]:
-            votes = []
-            if "labels" in details:
-                for label, info in details["labels"].items():
-                    for vote in info.get("all", []):
-                        if vote.get("_account_id") == reviewer.get("_account_id"):
-                            vote_value = vote.get("value", 0)
-                            vote_str = (
-                                f"+{vote_value}" if vote_value > 0 else str(vote_value)
-                            )
-                            votes.append(f"{label}: {vote_str}")
+            votes = votes_by_account.get(reviewer.get("_account_id"), [])
             reviewer_email = reviewer.get("email", "N/A")
-            output += f"- {reviewer_email} ({', '.join(votes)})\n"
+            parts.append(f"- {reviewer_email} ({', '.join(votes)})\n")
 
     if "messages" in details and details["messages"]:
-        output += "Recent Messages:\n"
+        parts.append("Recent Messages:\n")
         for msg in details["messages"][-3:]:
             author = msg.get("author", {}).get("name", "Gerrit")
             timestamp = msg.get("date", "No date")
             message_summary = msg["message"].splitlines()[0]
-            output += f"- (Patch Set {msg['_revision_number']}) [{timestamp}] ({author}): {message_summary}\n"
+            parts.append(
+                f"- (Patch Set {msg['_revision_number']}) [{timestamp}] ({author}): {message_summary}\n"
+            )
 
-    return [{"type": "text", "text": output}]
+    return _text("".join(parts))
 
 
 @mcp.tool()
@@ -428,49 +583,38 @@ async def get_commit_message(
     """
     Gets the commit message of a change from the current patch set.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/message"
 
     try:
         result_str = await run_curl([url], base_url)
-        commit_info = json.loads(result_str)
-
-        output = f"Commit message for CL {change_id}:\n"
-        output += f"Subject: {commit_info.get('subject', 'N/A')}\n\n"
-        output += "Full Message:\n"
-        output += "--------------------------------------------------------\n"
-        output += f"{commit_info.get('full_message', 'Message not found.')}\n"
-        output += "--------------------------------------------------------\n"
+        commit_info = json_utils.loads(result_str)
+
+        parts = [
+            f"Commit message for CL {change_id}:\n",
+            f"Subject: {commit_info.get('subject', 'N/A')}\n\n",
+            "Full Message:\n",
+            "--------------------------------------------------------\n",
+            f"{commit_info.get('full_message', 'Message not found.')}\n",
+            "--------------------------------------------------------\n",
+        ]
 
         if "footers" in commit_info and commit_info["footers"]:
-            output += "\nFooters:\n"
+            parts.append("\nFooters:\n")
             for key, value in commit_info["footers"].items():
-                output += f"- {key}: {value}\n"
+                parts.append(f"- {key}: {value}\n")
 
-        return [{"type": "text", "text": output}]
+        return _text("".join(parts))
 
     except json.JSONDecodeError:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to get commit message for CL {change_id}. Invalid JSON response.",
-            }
-        ]
+        return _text(
+            f"Failed to get commit message for CL {change_id}. Invalid JSON response."
+        )
     except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error getting commit message for CL {change_id}: {e}\n"
-            )
-        return [
-            {
-                "type": "text",
-                "text": f"An error occurred while getting the commit message for CL {change_id}: {e}",
-            }
-        ]
+        logger.error("Error getting commit message for CL %s: %s", change_id, e)
+        return _text(
+            f"An error occurred while getting the commit message for CL {change_id}: {e}"
+        )
 
 
 @mcp.tool()
@@ -478,22 +622,19 @@ async def list_change_files(change_id: str, gerrit_base_url: Optional[str] = Non
     """
     Lists all files modified in the most recent patch set of a CL.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/revisions/current/files/"
-    result_json_str = await run_curl([url], base_url)
-    files = json.loads(result_json_str)
-
-    # We need the revision number for the patch set
+    # We need the revision number for the patch set. The two requests are
+    # independent, so issue them concurrently.
     detail_url = f"{base_url}/changes/{change_id}/detail"
-    detail_json_str = await run_curl([detail_url], base_url)
-    details = json.loads(detail_json_str)
+    result_json_str, detail_json_str = await asyncio.gather(
+        run_curl([url], base_url), run_curl([detail_url], base_url)
+    )
+    files = json_utils.loads(result_json_str)
+    details = json_utils.loads(detail_json_str)
     patch_set = details.get("current_revision_number", "current")
 
-    output = f"Files in CL {change_id} (Patch Set {patch_set}):\n"
+    parts = [f"Files in CL {change_id} (Patch Set {patch_set}):\n"]
     for file_path, file_info in files.items():
         if file_path == "/COMMIT_MSG":
             continue
@@ -501,9 +642,11 @@ async def list_change_files(change_id: str, gerrit_base_url: Optional[str] = Non
         status_char = status[0] if status in ["ADDED", "DELETED", "RENAMED"] else "M"
         lines_inserted = file_info.get("lines_inserted", 0)
         lines_deleted = file_info.get("lines_deleted", 0)
-        output += f"[{status_char}] {file_path} (+{lines_inserted}, -{lines_deleted})\n"
+        parts.append(
+            f"[{status_char}] {file_path} (+{lines_inserted}, -{lines_deleted})\n"
+        )
 
-    return [{"type": "text", "text": output}]
+    return _text("".join(parts))
 
 
 @mcp.tool()
@@ -513,19 +656,16 @@ async def get_file_diff(
     """
     Retrieves the diff for a single, specified file within a CL.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     encoded_file_path = quote(file_path, safe="")
     url = f"{base_url}/changes/{change_id}/revisions/current/patch?path={encoded_file_path}"
 
     diff_base64 = await run_curl([url], base_url)
     # The response is a base64 encoded string, we need to decode it.
-    # The result from run_curl is already a string, so we encode it back to bytes for b64decode
-    diff_text = base64.b64decode(diff_base64.encode("utf-8")).decode("utf-8")
-    return [{"type": "text", "text": diff_text}]
+    # b64decode accepts the ASCII str directly, so there is no need to
+    # encode it back to bytes first.
+    diff_text = base64.b64decode(diff_base64).decode("utf-8")
+    return _text(diff_text)
 
 
 @mcp.tool()
@@ -533,27 +673,20 @@ async def list_change_comments(change_id: str, gerrit_base_url: Optional[str] =
     """
     list_change_comments is useful for reviewing feedback, reading comments on a change, analyzing comments, and responding to comments.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/comments"
     result_json_str = await run_curl([url], base_url)
     try:
-        comments_by_file = json.loads(result_json_str)
+        comments_by_file = json_utils.loads(result_json_str)
     except json.JSONDecodeError:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to parse JSON response from Gerrit. Raw response:\n{result_json_str}",
-            }
-        ]
+        return _text(
+            f"Failed to parse JSON response from Gerrit. Raw response:\n{result_json_str}"
+        )
 
-    output = f"Comments for CL {change_id}:\n"
+    parts = [f"Comments for CL {change_id}:\n"]
     found_comments = False
     for file_path, comments in comments_by_file.items():
-        output += f"---\nFile: {file_path}\n"
+        parts.append(f"---\nFile: {file_path}\n")
         found_comments = True
         for comment in comments:
             comment_id = comment.get("id", "")
@@ -565,15 +698,15 @@ async def list_change_comments(change_id: str, gerrit_base_url: Optional[str] =
             status = "UNRESOLVED" if comment.get("unresolved", False) else "RESOLVED"
             id_info = f" [id: {comment_id}]" if comment_id else ""
             reply_info = f" (in_reply_to: {in_reply_to})" if in_reply_to else ""
-            output += (
+            parts.append(
                 f"L{line}{id_info}{reply_info}: [{author}] ({timestamp}) - {status}\n"
             )
-            output += f"  {message}\n"
+            parts.append(f"  {message}\n")
 
     if not found_comments:
-        return [{"type": "text", "text": f"No comments found for CL {change_id}."}]
+        return _text(f"No comments found for CL {change_id}.")
 
-    return [{"type": "text", "text": output}]
+    return _text("".join(parts))
 
 
 @mcp.tool()
@@ -587,18 +720,11 @@ async def add_reviewer(
     Adds a user or a group to a CL as either a reviewer or a CC.
     """
     if state.upper() not in ["REVIEWER", "CC"]:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to add {reviewer}: Invalid state '{state}'. State must be either 'REVIEWER' or 'CC'.",
-            }
-        ]
+        return _text(
+            f"Failed to add {reviewer}: Invalid state '{state}'. State must be either 'REVIEWER' or 'CC'."
+        )
 
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/reviewers"
     payload = {"reviewer": reviewer, "state": state}
     args = _create_post_args(url, payload)
@@ -606,35 +732,21 @@ async def add_reviewer(
     try:
         result_str = await run_curl(args, base_url)
         try:
-            result_data = json.loads(result_str)
+            result_data = json_utils.loads(result_str)
             if "error" in result_data:
-                return [
-                    {
-                        "type": "text",
-                        "text": f"Failed to add {reviewer} as a {state} to CL {change_id}. Response: {result_data['error']}",
-                    }
-                ]
+                return _text(
+                    f"Failed to add {reviewer} as a {state} to CL {change_id}. Response: {result_data['error']}"
+                )
         except json.JSONDecodeError:
             # If the response is not JSON, it might be a plain text error from Gerrit
             if "error" in result_str.lower():
-                return [
-                    {
-                        "type": "text",
-                        "text": f"Failed to add {reviewer} as a {state} to CL {change_id}. Response: {result_str}",
-                    }
-                ]
-
-        return [
-            {
-                "type": "text",
-                "text": f"Successfully added {reviewer} as a {state} to CL {change_id}.",
-            }
-        ]
+                return _text(
+                    f"Failed to add {reviewer} as a {state} to CL {change_id}. Response: {result_str}"
+                )
+
+        return _text(f"Successfully added {reviewer} as a {state} to CL {change_id}.")
     except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error adding reviewer to CL {change_id}: {e}\n"
-            )
+        logger.error("Error adding reviewer to CL %s: %s", change_id, e)
         raise e
 
 
@@ -646,29 +758,19 @@ async def set_ready_for_review(
     """
     Sets a CL as ready for review.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/ready"
     args = _create_post_args(url)
 
     try:
         result_json = await run_curl(args, base_url)
         if result_json:
-            return [
-                {
-                    "type": "text",
-                    "text": f"Failed to set CL {change_id} as ready for review. Response: {result_json}",
-                }
-            ]
-        return [{"type": "text", "text": f"CL {change_id} is now ready for review."}]
-    except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error setting CL {change_id} as ready for review: {e}\n"
+            return _text(
+                f"Failed to set CL {change_id} as ready for review. Response: {result_json}"
             )
+        return _text(f"CL {change_id} is now ready for review.")
+    except Exception as e:
+        logger.error("Error setting CL %s as ready for review: %s", change_id, e)
         raise e
 
 
@@ -681,11 +783,7 @@ async def set_work_in_progress(
     """
     Sets a CL as work-in-progress.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/wip"
     payload = {"message": message} if message else None
     args = _create_post_args(url, payload)
@@ -693,18 +791,12 @@ async def set_work_in_progress(
     try:
         result_json = await run_curl(args, base_url)
         if result_json:
-            return [
-                {
-                    "type": "text",
-                    "text": f"Failed to set CL {change_id} as work-in-progress. Response: {result_json}",
-                }
-            ]
-        return [{"type": "text", "text": f"CL {change_id} is now a work-in-progress."}]
-    except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error setting CL {change_id} as work-in-progress: {e}\n"
+            return _text(
+                f"Failed to set CL {change_id} as work-in-progress. Response: {result_json}"
             )
+        return _text(f"CL {change_id} is now a work-in-progress.")
+    except Exception as e:
+        logger.error("Error setting CL %s as work-in-progress: %s", change_id, e)
         raise e
 
 
@@ -717,42 +809,27 @@ async def revert_change(
     """
     Reverts a single change, creating a new CL.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/revert"
     payload = {"message": message} if message else None
     args = _create_post_args(url, payload)
 
     try:
         result_str = await run_curl(args, base_url)
-        revert_info = json.loads(result_str)
+        revert_info = json_utils.loads(result_str)
         if "id" in revert_info and "_number" in revert_info:
             output = (
                 f"Successfully reverted CL {change_id}.\n"
                 f"New revert CL created: {revert_info['_number']}\n"
                 f"Subject: {revert_info['subject']}"
             )
-            return [{"type": "text", "text": output}]
+            return _text(output)
         else:
-            return [
-                {
-                    "type": "text",
-                    "text": f"Failed to revert CL {change_id}. Response: {result_str}",
-                }
-            ]
+            return _text(f"Failed to revert CL {change_id}. Response: {result_str}")
     except json.JSONDecodeError:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to revert CL {change_id}. Response: {result_str}",
-            }
-        ]
+        return _text(f"Failed to revert CL {change_id}. Response: {result_str}")
     except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(f"[gerrit-mcp-server] Error reverting CL {change_id}: {e}\n")
+        logger.error("Error reverting CL %s: %s", change_id, e)
         raise e
 
 
@@ -765,43 +842,32 @@ async def revert_submission(
     """
     Reverts an entire submission, creating one or more new CLs.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/revert_submission"
     payload = {"message": message} if message else None
     args = _create_post_args(url, payload)
 
     try:
         result_str = await run_curl(args, base_url)
-        submission_info = json.loads(result_str)
+        submission_info = json_utils.loads(result_str)
         if "revert_changes" in submission_info:
-            output = f"Successfully reverted submission for CL {change_id}.\n"
-            output += "Created revert changes:\n"
+            parts = [
+                f"Successfully reverted submission for CL {change_id}.\n",
+                "Created revert changes:\n",
+            ]
             for change in submission_info["revert_changes"]:
-                output += f"- {change['_number']}: {change['subject']}\n"
-            return [{"type": "text", "text": output}]
+                parts.append(f"- {change['_number']}: {change['subject']}\n")
+            return _text("".join(parts))
         else:
-            return [
-                {
-                    "type": "text",
-                    "text": f"Failed to revert submission for CL {change_id}. Response: {result_str}",
-                }
-            ]
+            return _text(
+                f"Failed to revert submission for CL {change_id}. Response: {result_str}"
+            )
     except json.JSONDecodeError:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to revert submission for CL {change_id}. Response: {result_str}",
-            }
-        ]
+        return _text(
+            f"Failed to revert submission for CL {change_id}. Response: {result_str}"
+        )
     except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error reverting submission for CL {change_id}: {e}\n"
-            )
+        logger.error("Error reverting submission for CL %s: %s", change_id, e)
         raise e
 
 
@@ -817,11 +883,7 @@ async def create_change(
     """
     Creates a new change in Gerrit.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/"
 
     payload = {
@@ -834,51 +896,32 @@ async def create_change(
     if status:
         payload["status"] = status
 
-    payload_json = json.dumps(payload)
-
-    args = [
-        "-X",
-        "POST",
-        "-H",
-        "Content-Type: application/json",
-        "--data",
-        payload_json,
-        url,
-    ]
+    args = _create_post_args(url, payload)
 
     try:
         result_str = await run_curl(args, base_url)
-        if not result_str.startswith("{"):
-            return [
-                {
-                    "type": "text",
-                    "text": f"Failed to create change. Response: {result_str}",
-                }
-            ]
-
-        change_info = json.loads(result_str)
-        if "id" in change_info and "_number" in change_info:
+        # Gerrit answers errors with a plain-text body, so anything that is not
+        # a ChangeInfo object is reported as a failure.
+        try:
+            change_info = json_utils.loads(result_str)
+        except json.JSONDecodeError:
+            change_info = None
+        if (
+            isinstance(change_info, dict)
+            and "id" in change_info
+            and "_number" in change_info
+        ):
             output = (
                 f"Successfully created new change {change_info['_number']}.\n"
                 f"Subject: {change_info['subject']}\n"
                 f"Project: {change_info['project']}, Branch: {change_info['branch']}"
             )
-            return [{"type": "text", "text": output}]
+            return _text(output)
         else:
-            return [
-                {
-                    "type": "text",
-                    "text": f"Failed to create change. Response: {result_str}",
-                }
-            ]
+            return _text(f"Failed to create change. Response: {result_str}")
 
     except Exception as e:
-        return [
-            {
-                "type": "text",
-                "text": f"An error occurred while creating the change: {e}",
-            }
-        ]
+        return _text(f"An error occurred while creating the change: {e}")
 
 
 @mcp.tool()
@@ -890,62 +933,26 @@ async def set_topic(
     """
     Sets the topic of a change. An empty string deletes the topic.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/topic"
 
-    payload = json.dumps({"topic": topic})
-    args = ["-X", "PUT", "-H", "Content-Type: application/json", "--data", payload, url]
+    args = _create_put_args(url, {"topic": topic})
 
     try:
         result_str = await run_curl(args, base_url)
+    except Exception as e:
+        return _text(
+            f"An error occurred while setting the topic for CL {change_id}: {e}"
+        )
 
-        if not result_str:
-            return [
-                {
-                    "type": "text",
-                    "text": f"Topic successfully deleted from CL {change_id}.",
-                }
-            ]
-
-        new_topic = json.loads(result_str)
-        return [
-            {
-                "type": "text",
-                "text": f"Successfully set topic for CL {change_id} to: {new_topic}",
-            }
-        ]
+    if not result_str:
+        return _text(f"Topic successfully deleted from CL {change_id}.")
 
-    except Exception as e:
-        # Check if the exception is a JSONDecodeError and try to get the response text
-        if isinstance(e, json.JSONDecodeError):
-            # The raw response is not directly available in the exception,
-            # so we have to re-run the command to get the raw output for the error message.
-            # This is not ideal, but it's the most reliable way to get the error message.
-            try:
-                raw_response = await run_curl(args, base_url)
-                return [
-                    {
-                        "type": "text",
-                        "text": f"Failed to set topic for CL {change_id}. Response: {raw_response}",
-                    }
-                ]
-            except Exception as inner_e:
-                return [
-                    {
-                        "type": "text",
-                        "text": f"An error occurred while setting the topic for CL {change_id}: {inner_e}",
-                    }
-                ]
-        return [
-            {
-                "type": "text",
-                "text": f"An error occurred while setting the topic for CL {change_id}: {e}",
-            }
-        ]
+    try:
+        new_topic = json_utils.loads(result_str)
+    except json.JSONDecodeError:
+        return _text(f"Failed to set topic for CL {change_id}. Response: {result_str}")
+    return _text(f"Successfully set topic for CL {change_id} to: {new_topic}")
 
 
 @mcp.tool()
@@ -957,25 +964,18 @@ async def changes_submitted_together(
     """
     Computes and lists all changes that would be submitted together with a given CL.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/submitted_together"
 
     if options:
-        query_params = "&".join([f"o={option}" for option in options])
-        url += f"?{query_params}"
+        url += "?" + urlencode([("o", option) for option in options], quote_via=quote)
 
     try:
         result_str = await run_curl([url], base_url)
         if not result_str:
-            return [
-                {"type": "text", "text": "This change would be submitted by itself."}
-            ]
+            return _text("This change would be submitted by itself.")
 
-        data = json.loads(result_str)
+        data = json_utils.loads(result_str)
 
         changes = []
         non_visible_changes = 0
@@ -987,33 +987,29 @@ async def changes_submitted_together(
             changes = data
 
         if not changes:
-            return [
-                {"type": "text", "text": "This change would be submitted by itself."}
-            ]
+            return _text("This change would be submitted by itself.")
 
-        output = f"The following {len(changes)} changes would be submitted together:\n"
+        parts = [
+            f"The following {len(changes)} changes would be submitted together:\n"
+        ]
         for change in changes:
-            output += f"- {change['_number']}: {change['subject']}\n"
+            parts.append(f"- {change['_number']}: {change['subject']}\n")
 
         if non_visible_changes > 0:
-            output += f"Plus {non_visible_changes} other changes that are not visible to you.\n"
+            parts.append(
+                f"Plus {non_visible_changes} other changes that are not visible to you.\n"
+            )
 
-        return [{"type": "text", "text": output}]
+        return _text("".join(parts))
 
     except json.JSONDecodeError:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to get submitted together info for CL {change_id}. Response: {result_str}",
-            }
-        ]
+        return _text(
+            f"Failed to get submitted together info for CL {change_id}. Response: {result_str}"
+        )
     except Exception as e:
-        return [
-            {
-                "type": "text",
-                "text": f"An error occurred while getting submitted together info for CL {change_id}: {e}",
-            }
-        ]
+        return _text(
+            f"An error occurred while getting submitted together info for CL {change_id}: {e}"
+        )
 
 
 @mcp.tool()
@@ -1028,54 +1024,49 @@ async def suggest_reviewers(
     """
     Suggests reviewers for a change based on a query.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
-    url = f"{base_url}/changes/{change_id}/suggest_reviewers?q={quote(query)}"
-
+    base_url = _resolve_base_url(gerrit_base_url)
+    params: List[Tuple[str, Any]] = [("q", query)]
     if limit:
-        url += f"&n={limit}"
+        params.append(("n", limit))
+    if reviewer_state:
+        params.append(("reviewer-state", reviewer_state))
+    url = f"{base_url}/changes/{change_id}/suggest_reviewers?" + urlencode(
+        params, quote_via=quote
+    )
+    # exclude-groups is a bare flag, so it is appended without a value.
     if exclude_groups:
         url += "&exclude-groups"
-    if reviewer_state:
-        url += f"&reviewer-state={reviewer_state}"
 
     try:
         result_str = await run_curl([url], base_url)
         if not result_str:
-            return [{"type": "text", "text": "No reviewers found for the given query."}]
+            return _text("No reviewers found for the given query.")
 
-        reviewers = json.loads(result_str)
+        reviewers = json_utils.loads(result_str)
         if not reviewers:
-            return [{"type": "text", "text": "No reviewers found for the given query."}]
+            return _text("No reviewers found for the given query.")
 
-        output = "Suggested reviewers:\n"
+        parts = ["Suggested reviewers:\n"]
         for suggestion in reviewers:
             if "account" in suggestion:
                 account = suggestion["account"]
-                output += f"- Account: {account.get('name', '')} ({account.get('email', 'No email')})\n"
+                parts.append(
+                    f"- Account: {account.get('name', '')} ({account.get('email', 'No email')})\n"
+                )
             elif "group" in suggestion:
                 group = suggestion["group"]
-                output += f"- Group: {group.get('name', 'Unnamed Group')}\n"
+                parts.append(f"- Group: {group.get('name', 'Unnamed Group')}\n")
 
-        return [{"type": "text", "text": output}]
+        return _text("".join(parts))
 
     except json.JSONDecodeError:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to get reviewer suggestions for CL {change_id}. Response: {result_str}",
-            }
-        ]
+        return _text(
+            f"Failed to get reviewer suggestions for CL {change_id}. Response: {result_str}"
+        )
     except Exception as e:
-        return [
-            {
-                "type": "text",
-                "text": f"An error occurred while suggesting reviewers for CL {change_id}: {e}",
-            }
-        ]
+        return _text(
+            f"An error occurred while suggesting reviewers for CL {change_id}: {e}"
+        )
 
 
 @mcp.tool()
@@ -1087,43 +1078,26 @@ async def abandon_change(
     """
     Abandons a change.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/abandon"
     payload = {"message": message} if message else None
     args = _create_post_args(url, payload)
 
     try:
         result_str = await run_curl(args, base_url)
-        abandon_info = json.loads(result_str)
+        abandon_info = json_utils.loads(result_str)
         if "id" in abandon_info and abandon_info.get("status") == "ABANDONED":
             output = (
                 f"Successfully abandoned CL {change_id}.\n"
                 f"Status: {abandon_info['status']}"
             )
-            return [{"type": "text", "text": output}]
+            return _text(output)
         else:
-            return [
-                {
-                    "type": "text",
-                    "text": f"Failed to abandon CL {change_id}. Response: {result_str}",
-                }
-            ]
+            return _text(f"Failed to abandon CL {change_id}. Response: {result_str}")
     except json.JSONDecodeError:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to abandon CL {change_id}. Response: {result_str}",
-            }
-        ]
+        return _text(f"Failed to abandon CL {change_id}. Response: {result_str}")
     except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error abandoning CL {change_id}: {e}\n"
-            )
+        logger.error("Error abandoning CL %s: %s", change_id, e)
         raise e
 
 
@@ -1132,25 +1106,21 @@ async def get_most_recent_cl(user: str, gerrit_base_url: Optional[str] = None):
     """
     Gets the most recent CL for a user.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     query = f"owner:{user}"
     url = f"{base_url}/changes/?q={quote(query)}&n=1"
     result_json_str = await run_curl([url], base_url)
-    changes = json.loads(result_json_str)
+    changes = json_utils.loads(result_json_str)
 
     if not changes:
-        return [{"type": "text", "text": f"No changes found for user: {user}"}]
+        return _text(f"No changes found for user: {user}")
 
     change = changes[0]
     wip_prefix = "[WIP] " if change.get("work_in_progress") else ""
     output = f"Most recent CL for {user}:\n"
     output += f"- {change['_number']}: {wip_prefix}{change['subject']}\n"
 
-    return [{"type": "text", "text": output}]
+    return _text(output)
 
 
 @mcp.tool()
@@ -1158,43 +1128,27 @@ async def get_bugs_from_cl(change_id: str, gerrit_base_url: Optional[str] = None
     """
     Extracts bug IDs from the commit message of a CL.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/revisions/current/commit"
     result_json_str = await run_curl([url], base_url)
     if not result_json_str:
-        return [
-            {"type": "text", "text": f"No commit message found for CL {change_id}."}
-        ]
-    details = json.loads(result_json_str)
+        return _text(f"No commit message found for CL {change_id}.")
+    details = json_utils.loads(result_json_str)
 
     commit_message = details.get("message")
 
     if not commit_message:
-        return [
-            {"type": "text", "text": f"No commit message found for CL {change_id}."}
-        ]
+        return _text(f"No commit message found for CL {change_id}.")
 
     bug_ids = extract_bugs_from_commit_message(commit_message)
 
     if not bug_ids:
-        return [
-            {
-                "type": "text",
-                "text": f"No bug IDs found in the commit message for CL {change_id}.",
-            }
-        ]
+        return _text(f"No bug IDs found in the commit message for CL {change_id}.")
 
-    bug_list_str = ", ".join(sorted(list(bug_ids)))
-    return [
-        {
-            "type": "text",
-            "text": f"Found bug(s): {bug_list_str}. Would you like me to get more details using the `@bugged` tool?",
-        }
-    ]
+    bug_list_str = ", ".join(sorted(bug_ids))
+    return _text(
+        f"Found bug(s): {bug_list_str}. Would you like me to get more details using the `@bugged` tool?"
+    )
 
 
 @mcp.tool()
@@ -1214,11 +1168,7 @@ async def post_review_comment(
     to find the id of the comment you want to reply to, then pass it as
     in_reply_to. Without in_reply_to, the comment is posted as a new thread.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/revisions/current/review"
 
     comment_input = {
@@ -1239,30 +1189,20 @@ async def post_review_comment(
 
     try:
         result_str = await run_curl(args, base_url)
-        # A successful response should contain the updated review information
-        if (
-            '"done": true' in result_str
-            or '"labels"' in result_str
-            or '"comments"' in result_str
-        ):
-            return [
-                {
-                    "type": "text",
-                    "text": f"Successfully posted comment to CL {change_id} on file {file_path} at line {line_number}.",
-                }
-            ]
+        # Gerrit answers a successful review with a ReviewResult object and
+        # errors with a plain-text body or a ReviewResult carrying "error".
+        try:
+            review_result = json_utils.loads(result_str)
+        except json.JSONDecodeError:
+            review_result = None
+        if isinstance(review_result, dict) and "error" not in review_result:
+            return _text(
+                f"Successfully posted comment to CL {change_id} on file {file_path} at line {line_number}."
+            )
         else:
-            return [
-                {
-                    "type": "text",
-                    "text": f"Failed to post comment. Response: {result_str}",
-                }
-            ]
+            return _text(f"Failed to post comment. Response: {result_str}")
     except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error posting comment to CL {change_id}: {e}\n"
-            )
+        logger.error("Error posting comment to CL %s: %s", change_id, e)
         raise e
 
 
@@ -1281,11 +1221,7 @@ async def create_draft_comment(
     Draft comments are private to the calling user and are NOT visible
     to others until published via publish_draft_comments.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/revisions/current/drafts"
 
     payload = {
@@ -1301,23 +1237,15 @@ async def create_draft_comment(
 
     try:
         result_str = await run_curl(args, base_url)
-        draft_info = json.loads(result_str)
+        draft_info = json_utils.loads(result_str)
         draft_id = draft_info.get("id", "unknown")
-        return [
-            {
-                "type": "text",
-                "text": (
-                    f"Created draft comment on CL {change_id}, "
-                    f"file {file_path} at line {line_number}. "
-                    f"Draft ID: {draft_id}"
-                ),
-            }
-        ]
+        return _text(
+            f"Created draft comment on CL {change_id}, "
+            f"file {file_path} at line {line_number}. "
+            f"Draft ID: {draft_id}"
+        )
     except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error creating draft on CL {change_id}: {e}\n"
-            )
+        logger.error("Error creating draft on CL %s: %s", change_id, e)
         raise e
 
 
@@ -1329,43 +1257,31 @@ async def list_draft_comments(
     """
     Lists all draft comments for a CL that belong to the calling user.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/drafts"
 
     try:
         result_str = await run_curl([url], base_url)
-        drafts_by_file = json.loads(result_str)
+        drafts_by_file = json_utils.loads(result_str)
 
         if not drafts_by_file:
-            return [
-                {
-                    "type": "text",
-                    "text": f"No draft comments found for CL {change_id}.",
-                }
-            ]
+            return _text(f"No draft comments found for CL {change_id}.")
 
-        output = f"Draft comments for CL {change_id}:\n"
+        parts = [f"Draft comments for CL {change_id}:\n"]
         for fp, drafts in drafts_by_file.items():
-            output += f"---\nFile: {fp}\n"
+            parts.append(f"---\nFile: {fp}\n")
             for draft in drafts:
                 line = draft.get("line", "File")
                 draft_id = draft.get("id", "unknown")
                 msg = draft.get("message", "")
                 unresolved = draft.get("unresolved", True)
-                output += (
+                parts.append(
                     f"  L{line} [ID: {draft_id}] (unresolved={unresolved}): {msg}\n"
                 )
 
-        return [{"type": "text", "text": output}]
+        return _text("".join(parts))
     except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error listing drafts for CL {change_id}: {e}\n"
-            )
+        logger.error("Error listing drafts for CL %s: %s", change_id, e)
         raise e
 
 
@@ -1380,11 +1296,7 @@ async def publish_draft_comments(
     Publishes all pending draft comments on the current revision of a CL.
     Optionally adds a top-level review message and/or sets labels.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
     url = f"{base_url}/changes/{change_id}/revisions/current/review"
 
     payload: Dict[str, Any] = {
@@ -1399,17 +1311,9 @@ async def publish_draft_comments(
 
     try:
         result_str = await run_curl(args, base_url)
-        return [
-            {
-                "type": "text",
-                "text": f"Successfully published draft comments on CL {change_id}.",
-            }
-        ]
+        return _text(f"Successfully published draft comments on CL {change_id}.")
     except Exception as e:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error publishing drafts on CL {change_id}: {e}\n"
-            )
+        logger.error("Error publishing drafts on CL %s: %s", change_id, e)
         raise e
 
 
@@ -1420,8 +1324,9 @@ def _format_job_duration(job: Dict[str, Any]) -> str:
     if not started or not stopped:
         return ""
     try:
-        start_dt = datetime.datetime.fromisoformat(started.replace("Z", "+00:00"))
-        stop_dt = datetime.datetime.fromisoformat(stopped.replace("Z", "+00:00"))
+        # fromisoformat accepts the trailing "Z" on the Python versions we support
+        start_dt = datetime.datetime.fromisoformat(started)
+        stop_dt = datetime.datetime.fromisoformat(stopped)
         seconds = int((stop_dt - start_dt).total_seconds())
         if seconds < 60:
             return f" ({seconds}s)"
@@ -1442,6 +1347,16 @@ def _build_circleci_job_url(workflow: Dict[str, Any], job: Dict[str, Any]) -> st
     )
 
 
+def _circleci_status_url(
+    base_url: str, gerrit_change_id: str, branch: str, project: str
+) -> str:
+    """Builds the CircleCI plugin status URL for a change."""
+    return (
+        f"{base_url}/plugins/circleci/status"
+        f"?changeId={quote(gerrit_change_id)}&branch={quote(branch)}&project={quote(project)}"
+    )
+
+
 @mcp.tool()
 async def get_circleci_status(
     change_id: str,
@@ -1452,97 +1367,113 @@ async def get_circleci_status(
     Each check includes its state (SUCCESSFUL, FAILED, RUNNING, etc.) and
     a URL linking to the CI result. Use state_filter='FAILED' to see only failures.
     """
-    config = load_gerrit_config()
-    gerrit_hosts = config.get("gerrit_hosts", [])
-    base_url = _normalize_gerrit_url(
-        _get_gerrit_base_url(gerrit_base_url), gerrit_hosts
-    )
+    base_url = _resolve_base_url(gerrit_base_url)
 
-    # Step 1: Fetch change details to get the full change_id, project, and branch
+    # Step 1: Fetch change details to get the full change_id, project, and branch.
+    # A project~branch~Change-Id triplet already names everything the plugin
+    # needs, so its status request can run alongside the details request.
     detail_url = f"{base_url}/changes/{change_id}"
+    requests = [run_curl([detail_url], base_url)]
+    prefetched_status_url = None
+    triplet = change_id.split("~")
+    if len(triplet) == 3 and all(triplet):
+        project, branch, gerrit_change_id = (unquote(part) for part in triplet)
+        prefetched_status_url = _circleci_status_url(
+            base_url, gerrit_change_id, branch, project
+        )
+        requests.append(run_curl([prefetched_status_url], base_url))
+    results = await asyncio.gather(*requests, return_exceptions=True)
+
     try:
-        detail_json_str = await run_curl([detail_url], base_url)
-        details = json.loads(detail_json_str)
+        if isinstance(results[0], BaseException):
+            raise results[0]
+        details = json_utils.loads(results[0])
     except Exception as e:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to fetch change details for CL {change_id}: {e}",
-            }
-        ]
+        return _text(f"Failed to fetch change details for CL {change_id}: {e}")
 
     gerrit_change_id = details.get("change_id", "")
     project = details.get("project", "")
     branch = details.get("branch", "")
     cl_number = details.get("_number", change_id)
 
-    # Step 2: Call the CircleCI plugin status endpoint
-    status_url = (
-        f"{base_url}/plugins/circleci/status"
-        f"?changeId={quote(gerrit_change_id)}&branch={quote(branch)}&project={quote(project)}"
-    )
+    # Step 2: Call the CircleCI plugin status endpoint, unless already fetched
+    status_url = _circleci_status_url(base_url, gerrit_change_id, branch, project)
     try:
-        status_json_str = await run_curl([status_url], base_url)
-        workflows = json.loads(status_json_str)
+        if status_url == prefetched_status_url:
+            if isinstance(results[1], BaseException):
+                raise results[1]
+            status_json_str = results[1]
+        else:
+            status_json_str = await run_curl([status_url], base_url)
+        workflows = json_utils.loads(status_json_str)
     except json.JSONDecodeError:
-        return [
-            {
-                "type": "text",
-                "text": f"Failed to parse CircleCI status response for CL {cl_number}. "
-                "The CircleCI plugin may not be installed on this Gerrit instance.",
-            }
-        ]
+        return _text(
+            f"Failed to parse CircleCI status response for CL {cl_number}. "
+            "The CircleCI plugin may not be installed on this Gerrit instance."
+        )
     except Exception as e:
         error_str = str(e)
         if "404" in error_str:
-            return [
-                {
-                    "type": "text",
-                    "text": f"No CircleCI status endpoint found for CL {cl_number}. "
-                    "The CircleCI plugin may not be installed on this Gerrit instance.",
-                }
-            ]
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(
-                f"[gerrit-mcp-server] Error fetching CircleCI status for CL {cl_number}: {e}\n"
+            return _text(
+                f"No CircleCI status endpoint found for CL {cl_number}. "
+                "The CircleCI plugin may not be installed on this Gerrit instance."
             )
+        logger.error("Error fetching CircleCI status for CL %s: %s", cl_number, e)
         raise e
 
     if not workflows:
-        return [
-            {
-                "type": "text",
-                "text": f"No CircleCI workflows found for CL {cl_number}.",
-            }
-        ]
+        return _text(f"No CircleCI workflows found for CL {cl_number}.")
 
-    output = f"CircleCI Status for CL {cl_number}:\n\n"
+    parts = [f"CircleCI Status for CL {cl_number}:\n\n"]
     for workflow in workflows:
         wf_name = workflow.get("name", "unknown")
         wf_status = workflow.get("status", "unknown")
         pipeline_num = workflow.get("pipeline_number", "")
-        output += f"[{wf_status.upper()}] {wf_name} (pipeline #{pipeline_num})\n"
+        parts.append(f"[{wf_status.upper()}] {wf_name} (pipeline #{pipeline_num})\n")
 
         for job in workflow.get("jobs", []):
             job_name = job.get("name", "unknown")
             job_status = job.get("status", "unknown")
             duration = _format_job_duration(job)
-            output += f"  [{job_status}] {job_name}{duration}\n"
+            parts.append(f"  [{job_status}] {job_name}{duration}\n")
             if job_status in ("failed", "infrastructure_fail", "timedout"):
-                output += f"    URL: {_build_circleci_job_url(workflow, job)}\n"
+                parts.append(f"    URL: {_build_circleci_job_url(workflow, job)}\n")
 
-        output += "\n"
+        parts.append("\n")
 
-    status_counts: Dict[str, int] = {}
-    for workflow in workflows:
-        s = workflow.get("status", "unknown")
-        status_counts[s] = status_counts.get(s, 0) + 1
+    status_counts = Counter(workflow.get("status", "unknown") for workflow in workflows)
     summary_parts = [
         f"{count} {status}" for status, count in sorted(status_counts.items())
     ]
-    output += f"Summary: {', '.join(summary_parts)} ({len(workflows)} workflows)"
+    parts.append(f"Summary: {', '.join(summary_parts)} ({len(workflows)} workflows)")
+
+    return _text("".join(parts))
+
+
+# Upper bound on the per-CL requests a bulk tool keeps in flight at once.
+_BULK_CONCURRENCY = 8
+
+
+@mcp.tool()
+async def get_circleci_status_bulk(
+    change_ids: List[str],
+    gerrit_base_url: Optional[str] = None,
+):
+    """
+    Retrieves CircleCI statuses for several CLs at once, such as a stack of
+    open CLs. Returns one status report per CL, in the order given.
+    """
+    semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+
+    async def fetch(change_id: str):
+        async with semaphore:
+            try:
+                return await get_circleci_status(change_id, gerrit_base_url)
+            except Exception as e:
+                return _text(f"Failed to fetch CircleCI status for CL {change_id}: {e}")
 
-    return [{"type": "text", "text": output}]
+    results = await asyncio.gather(*(fetch(change_id) for change_id in change_ids))
+    return [content for result in results for content in result]
 
 
 def cli_main(argv: Optional[List[str]] = None):
@@ -4,6 +4,7 @@ Bootstraps config from sample if needed, ensures the venv is built,
 and runs the pytest suite.
 """
 
+import argparse
 import os
 import shutil
 import subprocess
@@ -28,7 +29,7 @@ def venv_executable(name: str) -> Path:
     return Path(VENV_DIR) / "bin" / name
 
 
-def run_tests():
+def run_tests(integration: bool = False):
     # Config bootstrap -- create from sample if it doesn't exist
     if not CONFIG_FILE.exists():
         print(f"{YELLOW}Configuration file not found. Creating from sample...{NC}")
@@ -51,6 +52,8 @@ def run_tests():
     env = os.environ.copy()
     env["PYTHONPATH"] = project_root
     env["GERRIT_CONFIG_PATH"] = str(Path(project_root) / "tests" / "test_config.json")
+    if integration:
+        env["RUN_INTEGRATION"] = "1"
 
     python = str(venv_executable("python"))
 
@@ -64,4 +67,11 @@ def run_tests():
 
 
 if __name__ == "__main__":
-    run_tests()
+    parser = argparse.ArgumentParser(description="Run the Gerrit MCP server tests.")
+    parser.add_argument(
+        "--integration",
+        action="store_true",
+        help="Also run the slow build-and-run integration tests.",
+    )
+    cli_args = parser.parse_args()
+    run_tests(integration=cli_args.integration)
@@ -6,11 +6,13 @@ the uvicorn process.
 Usage: python server.py {start|stop|restart|status|logs}
 """
 
+import ctypes
 import os
 import signal
 import subprocess
 import sys
 import time
+from ctypes import wintypes
 from pathlib import Path
 
 VENV_DIR = ".venv"
@@ -21,6 +23,12 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 PID_FILE = SCRIPT_DIR / "server.pid"
 LOG_FILE = SCRIPT_DIR / "server.log"
 
+# Windows process access right and exit code used by is_process_running.
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+STILL_ACTIVE = 259
+# inotify event mask used by tail_logs on Linux.
+IN_MODIFY = 0x00000002
+
 
 def venv_executable(name: str) -> Path:
     """Return path to an executable inside the venv, platform-aware."""
@@ -32,11 +40,30 @@ def venv_executable(name: str) -> Path:
 def is_process_running(pid: int) -> bool:
     """Check whether a process with the given PID is alive."""
     if sys.platform == "win32":
-        result = subprocess.run(
-            ["tasklist", "/FI", f"PID eq {pid}", "/NH"],
-            capture_output=True, text=True,
+        # Query the process directly instead of spawning tasklist per check.
+        # The signatures are declared so the HANDLE is not truncated to a C int
+        # on 64-bit Windows.
+        kernel32 = ctypes.windll.kernel32
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+        kernel32.GetExitCodeProcess.restype = wintypes.BOOL
+        kernel32.GetExitCodeProcess.argtypes = (
+            wintypes.HANDLE,
+            ctypes.POINTER(wintypes.DWORD),
         )
-        return str(pid) in result.stdout
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = wintypes.DWORD()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return False
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
     else:
         try:
             os.kill(pid, 0)
@@ -164,6 +191,26 @@ def check_status():
         print("Server is STOPPED.")
 
 
+def _open_inotify_watch(path: Path) -> int | None:
+    """Return an inotify descriptor that becomes readable when path is written.
+
+    Returns None where inotify is unavailable, in which case callers poll.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(path), IN_MODIFY) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
 def tail_logs():
     if not LOG_FILE.exists():
         print(f"Log file not found: {LOG_FILE}")
@@ -171,18 +218,25 @@ def tail_logs():
         sys.exit(1)
 
     print(f"Tailing logs from {LOG_FILE}... (Press Ctrl+C to stop)")
+    watch_fd = _open_inotify_watch(LOG_FILE)
     try:
         with open(LOG_FILE, "r") as f:
             # Seek to end
             f.seek(0, 2)
             while True:
-                line = f.readline()
-                if line:
-                    print(line, end="")
+                output = f.read()
+                if output:
+                    print(output, end="", flush=True)
+                elif watch_fd is not None:
+                    # Block until the file is written to again.
+                    os.read(watch_fd, 4096)
                 else:
                     time.sleep(0.3)
     except KeyboardInterrupt:
         pass
+    finally:
+        if watch_fd is not None:
+            os.close(watch_fd)
 
 
 def restart_server():
@@ -12,41 +12,104 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+"""
+Builds the project in a scratch workspace and drives server.py against it.
+
+These tests install every dependency into a fresh virtual environment, so they
+are far slower than the rest of the suite and only run when RUN_INTEGRATION=1
+is set (for example via `python run_tests.py --integration`).
+"""
+
+import contextlib
+import errno
+import importlib.util
+import io
 import unittest
 import tempfile
 import shutil
+import socket
 import subprocess
 import os
 import sys
 import time
 import json
+from unittest.mock import patch
+
+
+# A high, static port for the test server, to avoid conflicts
+TEST_PORT = 8999
+
+
+def _workspace_parent_dir():
+    """Returns the directory to create test workspaces in, or None for the default.
+
+    GERRIT_MCP_TEST_TMPDIR takes precedence. Otherwise the RAM-backed /dev/shm
+    is used on Linux when it can hold a virtual environment and run its scripts.
+    """
+    override = os.environ.get("GERRIT_MCP_TEST_TMPDIR")
+    if override:
+        return override
+    if sys.platform.startswith("linux") and os.path.isdir("/dev/shm"):
+        shm = os.statvfs("/dev/shm")
+        if not shm.f_flag & os.ST_NOEXEC and shm.f_bavail * shm.f_frsize >= 1 << 30:
+            return "/dev/shm"
+    return None
 
 
+def _link_tree(src, dst):
+    """Clone the src tree into dst with hard links instead of copies.
+
+    Files are copied only when dst is on another filesystem.
+    """
+    for root, _, files in os.walk(src):
+        target_root = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target_root, exist_ok=True)
+        for file_name in files:
+            source = os.path.join(root, file_name)
+            target = os.path.join(target_root, file_name)
+            try:
+                os.link(source, target)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copyfile(source, target)
+
+
+@unittest.skipUnless(
+    os.environ.get("RUN_INTEGRATION") == "1", "set RUN_INTEGRATION=1 to enable"
+)
 class TestBuildAndRun(unittest.TestCase):
-    def setUp(self):
-        """Set up a temporary directory for the test."""
-        self.test_dir = tempfile.TemporaryDirectory()
-        self.project_root = os.path.abspath(
+    @classmethod
+    def setUpClass(cls):
+        """Prepare a template workspace that each test clones."""
+        cls._template_dir = tempfile.TemporaryDirectory(dir=_workspace_parent_dir())
+        template = cls._template_dir.name
+        project_root = os.path.abspath(
             os.path.join(os.path.dirname(__file__), "..", "..")
         )
 
-        # Files and directories to copy to the temporary directory
-        self.files_to_copy = [
+        # Files and directories to copy to the template directory
+        files_to_copy = [
             "build.py",
             "pyproject.toml",
-            "server.py",
             "run_tests.py",
             "uv-requirements.txt",
+            "uv.lock",
         ]
-        self.dirs_to_copy = ["gerrit_mcp_server"]
+        dirs_to_copy = ["gerrit_mcp_server"]
 
-        for file_name in self.files_to_copy:
-            shutil.copy(os.path.join(self.project_root, file_name), self.test_dir.name)
+        # Only contents matter in the sandbox, so skip copy2's metadata copying
+        for file_name in files_to_copy:
+            shutil.copyfile(
+                os.path.join(project_root, file_name),
+                os.path.join(template, file_name),
+            )
 
-        for dir_name in self.dirs_to_copy:
+        for dir_name in dirs_to_copy:
             shutil.copytree(
-                os.path.join(self.project_root, dir_name),
-                os.path.join(self.test_dir.name, dir_name),
+                os.path.join(project_root, dir_name),
+                os.path.join(template, dir_name),
+                copy_function=shutil.copyfile,
             )
 
         # Create a dummy gerrit_config.json for the test environment
@@ -61,24 +124,37 @@ class TestBuildAndRun(unittest.TestCase):
             ],
         }
         gerrit_config_path = os.path.join(
-            self.test_dir.name, "gerrit_mcp_server", "gerrit_config.json"
+            template, "gerrit_mcp_server", "gerrit_config.json"
         )
         with open(gerrit_config_path, "w") as f:
             json.dump(dummy_config, f)
 
-        # Modify server.py to use a different port for testing
-        server_script_path = os.path.join(self.test_dir.name, "server.py")
-        with open(server_script_path, "r") as f:
+        # Write server.py already patched to use a different port for testing
+        with open(os.path.join(project_root, "server.py"), "r") as f:
             server_script_content = f.read()
 
         # Use a high, static port for testing to avoid conflicts
         server_script_content = server_script_content.replace(
-            'PORT = "6322"', 'PORT = "8999"'
+            'PORT = "6322"', f'PORT = "{TEST_PORT}"'
         )
 
-        with open(server_script_path, "w") as f:
+        with open(os.path.join(template, "server.py"), "w") as f:
             f.write(server_script_content)
 
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the template directory."""
+        cls._template_dir.cleanup()
+
+    def setUp(self):
+        """Set up a temporary directory for the test from the template."""
+        # The template is never shared with the repository and the tests only
+        # add or remove files in their clone, so hard links are safe here.
+        self.test_dir = tempfile.TemporaryDirectory(
+            dir=os.path.dirname(self._template_dir.name)
+        )
+        _link_tree(self._template_dir.name, self.test_dir.name)
+
     def tearDown(self):
         """Clean up the temporary directory."""
         self.test_dir.cleanup()
@@ -88,30 +164,15 @@ class TestBuildAndRun(unittest.TestCase):
         Tests the full build and server run lifecycle using the Python scripts.
         """
         # 1. Run the build script
-        build_script_path = os.path.join(self.test_dir.name, "build.py")
-        build_process = subprocess.run(
-            [sys.executable, build_script_path],
-            cwd=self.test_dir.name,
-            capture_output=True,
-            text=True,
-        )
-
-        self.assertEqual(
-            build_process.returncode,
-            0,
-            f"Build script failed with output:\n{build_process.stdout}\n{build_process.stderr}",
-        )
-        self.assertTrue(os.path.exists(os.path.join(self.test_dir.name, ".venv")))
+        self._run_build()
+        # pyvenv.cfg only exists inside a created venv, so one stat covers both.
         self.assertTrue(
-            os.path.exists(os.path.join(self.test_dir.name, "requirements.txt"))
+            os.path.isfile(os.path.join(self.test_dir.name, ".venv", "pyvenv.cfg"))
         )
 
         # 2. Run the server using server.py
         server_script_path = os.path.join(self.test_dir.name, "server.py")
 
-        server_env = os.environ.copy()
-        server_env["PYTHONPATH"] = self.test_dir.name
-
         # Start the server with platform-aware process creation
         popen_kwargs = {}
         if sys.platform == "win32":
@@ -139,55 +200,123 @@ class TestBuildAndRun(unittest.TestCase):
                 f"SERVER LOG (server.log):\n{log_content}"
             )
 
-        # Give the server a moment to start up
-        time.sleep(2)
-
-        # 3. Verify the server is running with server.py status
-        status_process = subprocess.run(
-            [sys.executable, server_script_path, "status"],
-            cwd=self.test_dir.name,
-            capture_output=True,
-            text=True,
-            env=server_env,
-        )
-        self.assertEqual(
-            status_process.returncode,
-            0,
-            f"server.py status failed:\n{status_process.stderr}",
+        # Wait until the server accepts connections instead of sleeping blindly
+        self.assertTrue(
+            self._wait_for_port(TEST_PORT, timeout=5.0),
+            f"Server did not accept connections on port {TEST_PORT} within 5s.",
         )
-        self.assertIn("Server is RUNNING", status_process.stdout)
+
+        # 3. Verify the server is running with server.py status. Only start has
+        # to run in its own process; the other commands run in-process.
+        server = self._load_server_module(server_script_path)
+        exit_code, output = self._run_server_command(server, "status")
+        self.assertEqual(exit_code, 0, f"server.py status failed:\n{output}")
+        self.assertIn("Server is RUNNING", output)
 
         # 4. Stop the server
-        stop_process = subprocess.run(
-            [sys.executable, server_script_path, "stop"],
+        exit_code, output = self._run_server_command(server, "stop")
+        self.assertEqual(exit_code, 0, f"server.py stop failed:\n{output}")
+        self.assertIn("Server stopped", output)
+
+        # 5. Verify the server is stopped
+        _, output = self._run_server_command(server, "status")
+        self.assertIn("Server is STOPPED", output)
+
+    def test_rebuild_after_dependency_change_keeps_package(self):
+        """
+        Tests that rebuilding after the dependency inputs change still leaves
+        the gerrit_mcp_server package installed in the venv.
+        """
+        self._run_build()
+        # Replace the hard-linked file rather than appending to it, so the
+        # shared template stays untouched.
+        uv_requirements_path = os.path.join(self.test_dir.name, "uv-requirements.txt")
+        with open(uv_requirements_path, "r") as f:
+            uv_requirements = f.read()
+        os.remove(uv_requirements_path)
+        with open(uv_requirements_path, "w") as f:
+            f.write(uv_requirements + "# force a rebuild\n")
+        self._run_build()
+
+        # Isolated mode keeps the workspace's source tree off sys.path, so the
+        # import only succeeds against the installed package.
+        if sys.platform == "win32":
+            venv_python = os.path.join(
+                self.test_dir.name, ".venv", "Scripts", "python.exe"
+            )
+        else:
+            venv_python = os.path.join(self.test_dir.name, ".venv", "bin", "python")
+        import_process = subprocess.run(
+            [venv_python, "-I", "-c", "import gerrit_mcp_server.main"],
             cwd=self.test_dir.name,
             capture_output=True,
             text=True,
-            env=server_env,
         )
         self.assertEqual(
-            stop_process.returncode, 0, f"server.py stop failed:\n{stop_process.stderr}"
+            import_process.returncode,
+            0,
+            f"gerrit_mcp_server is not installed after a rebuild:\n"
+            f"{import_process.stderr}",
         )
-        self.assertIn("Server stopped", stop_process.stdout)
 
-        # 5. Verify the server is stopped
-        status_after_stop_process = subprocess.run(
-            [sys.executable, server_script_path, "status"],
-            cwd=self.test_dir.name,
-            capture_output=True,
-            text=True,
-            env=server_env,
+    def _run_build(self):
+        """Runs build.py in the workspace, failing the test if it fails."""
+        # The build is chatty, so its output goes to a file that is only read
+        # back when it fails.
+        with tempfile.TemporaryFile(mode="w+") as build_log:
+            build_process = subprocess.run(
+                [sys.executable, os.path.join(self.test_dir.name, "build.py")],
+                cwd=self.test_dir.name,
+                stdout=build_log,
+                stderr=subprocess.STDOUT,
+            )
+            if build_process.returncode != 0:
+                build_log.seek(0)
+                self.fail(f"Build script failed with output:\n{build_log.read()}")
+
+    @staticmethod
+    def _wait_for_port(port, timeout):
+        """Polls localhost:port until it accepts a connection or timeout passes."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("localhost", port), timeout=0.1):
+                    return True
+            except OSError:
+                time.sleep(0.05)
+        return False
+
+    @staticmethod
+    def _load_server_module(server_script_path):
+        """Imports the workspace's server.py under a name of its own."""
+        spec = importlib.util.spec_from_file_location(
+            "workspace_server", server_script_path
         )
-        self.assertIn("Server is STOPPED", status_after_stop_process.stdout)
+        server = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(server)
+        return server
+
+    @staticmethod
+    def _run_server_command(server, command):
+        """Runs a server.py command in-process, returning (exit code, stdout)."""
+        stdout = io.StringIO()
+        exit_code = 0
+        with patch.object(sys, "argv", ["server.py", command]):
+            with contextlib.redirect_stdout(stdout):
+                try:
+                    server.main()
+                except SystemExit as e:
+                    exit_code = e.code or 0
+        return exit_code, stdout.getvalue()
 
     def test_run_tests_fails_on_broken_build(self):
         """
         Tests that run_tests.py fails gracefully when the build cannot complete.
         """
-        # Remove uv-requirements.txt so the build will fail at the uv install step
-        uv_req_path = os.path.join(self.test_dir.name, "uv-requirements.txt")
-        if os.path.exists(uv_req_path):
-            os.remove(uv_req_path)
+        # Remove pyproject.toml so the build will fail at the dependency step
+        pyproject_path = os.path.join(self.test_dir.name, "pyproject.toml")
+        if os.path.exists(pyproject_path):
+            os.remove(pyproject_path)
 
         test_script_path = os.path.join(self.test_dir.name, "run_tests.py")
         test_process = subprocess.run(
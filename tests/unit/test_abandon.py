@@ -76,7 +76,7 @@ class TestAbandonChange(unittest.TestCase):
             mock_run_curl.assert_called_once()
             args, _ = mock_run_curl.call_args
             self.assertIn("--data", args[0])
-            self.assertIn('{"message": "No longer needed"}', args[0])
+            self.assertIn('{"message":"No longer needed"}', args[0])
 
         asyncio.run(run_test())
 
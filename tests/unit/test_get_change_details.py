@@ -67,6 +67,49 @@ class TestGetChangeDetails(unittest.TestCase):
 
         asyncio.run(run_test())
 
+    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
+    def test_get_change_details_votes_per_reviewer(self, mock_run_curl):
+        async def run_test():
+            # Arrange
+            mock_response = {
+                "_number": 12345,
+                "subject": "Test Subject",
+                "owner": {"email": "owner@example.com"},
+                "status": "NEW",
+                "reviewers": {
+                    "REVIEWER": [
+                        {"email": "first@example.com", "_account_id": 1},
+                        {"email": "second@example.com", "_account_id": 2},
+                        {"email": "silent@example.com", "_account_id": 3},
+                    ]
+                },
+                "labels": {
+                    "Code-Review": {
+                        "all": [
+                            {"value": 2, "_account_id": 1},
+                            {"value": -1, "_account_id": 2},
+                        ]
+                    },
+                    "Verified": {"all": [{"value": 1, "_account_id": 1}]},
+                },
+            }
+            mock_run_curl.return_value = json.dumps(mock_response)
+
+            # Act
+            result = await main.get_change_details(
+                "12345", gerrit_base_url="https://my-gerrit.com"
+            )
+
+            # Assert
+            text = result[0]["text"]
+            self.assertIn(
+                "- first@example.com (Code-Review: +2, Verified: +1)", text
+            )
+            self.assertIn("- second@example.com (Code-Review: -1)", text)
+            self.assertIn("- silent@example.com ()", text)
+
+        asyncio.run(run_test())
+
 
 if __name__ == "__main__":
     unittest.main()
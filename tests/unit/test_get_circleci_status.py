@@ -1,6 +1,5 @@
 import unittest
 from unittest.mock import patch, AsyncMock
-import asyncio
 import json
 
 from gerrit_mcp_server import main
@@ -73,108 +72,128 @@ SAMPLE_WORKFLOWS = [
     },
 ]
 
-
-class TestGetCircleciStatus(unittest.TestCase):
-    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
-    def test_mixed_workflow_statuses(self, mock_run_curl):
-        async def run_test():
-            mock_run_curl.side_effect = [
-                json.dumps(SAMPLE_CHANGE_DETAIL),
-                json.dumps(SAMPLE_WORKFLOWS),
-            ]
-            gerrit_base_url = "https://my-gerrit.com"
-
-            result = await main.get_circleci_status(
-                "11286", gerrit_base_url=gerrit_base_url
-            )
-
-            text = result[0]["text"]
-            self.assertIn("CircleCI Status for CL 11286", text)
-            self.assertIn("[FAILED] build-windows-app", text)
-            self.assertIn("[SUCCESS] build-linux-ebpf", text)
-            self.assertIn("[success] cargo fmt check", text)
-            self.assertIn("[failed] build-windows-amd64", text)
-            self.assertIn("[blocked] sign-windows-artifacts", text)
-            # Failed jobs should have URLs
-            self.assertIn("URL: https://app.circleci.com/pipelines/gh/wiz-sec/sensor/36754/workflows/", text)
-            # Summary
-            self.assertIn("1 failed", text)
-            self.assertIn("1 success", text)
-            self.assertIn("2 workflows", text)
-
-        asyncio.run(run_test())
-
-    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
-    def test_job_duration_formatting(self, mock_run_curl):
-        async def run_test():
-            mock_run_curl.side_effect = [
-                json.dumps(SAMPLE_CHANGE_DETAIL),
-                json.dumps(SAMPLE_WORKFLOWS),
-            ]
-            gerrit_base_url = "https://my-gerrit.com"
-
-            result = await main.get_circleci_status(
-                "11286", gerrit_base_url=gerrit_base_url
-            )
-
-            text = result[0]["text"]
-            # cargo fmt check: 22:09:53 -> 22:10:21 = 28s
-            self.assertIn("(28s)", text)
-            # build-windows-amd64: 22:09:58 -> 22:21:39 = 11m41s
-            self.assertIn("(11m41s)", text)
-
-        asyncio.run(run_test())
-
-    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
-    def test_empty_workflows(self, mock_run_curl):
-        async def run_test():
-            mock_run_curl.side_effect = [
-                json.dumps(SAMPLE_CHANGE_DETAIL),
-                json.dumps([]),
-            ]
-            gerrit_base_url = "https://my-gerrit.com"
-
-            result = await main.get_circleci_status(
-                "11286", gerrit_base_url=gerrit_base_url
-            )
-
-            self.assertIn("No CircleCI workflows found for CL 11286", result[0]["text"])
-
-        asyncio.run(run_test())
-
-    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
-    def test_plugin_not_installed(self, mock_run_curl):
-        async def run_test():
-            mock_run_curl.side_effect = [
-                json.dumps(SAMPLE_CHANGE_DETAIL),
-                Exception("curl command failed with exit code 1.\nSTDERR:\n404 Not Found"),
-            ]
-            gerrit_base_url = "https://my-gerrit.com"
-
-            result = await main.get_circleci_status(
-                "11286", gerrit_base_url=gerrit_base_url
-            )
-
-            self.assertIn("No CircleCI status endpoint found", result[0]["text"])
-            self.assertIn("CircleCI plugin may not be installed", result[0]["text"])
-
-        asyncio.run(run_test())
-
-    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
-    def test_change_detail_fetch_failure(self, mock_run_curl):
-        async def run_test():
-            mock_run_curl.side_effect = Exception(
-                "curl command failed with exit code 1.\nSTDERR:\nConnection refused"
-            )
-            gerrit_base_url = "https://my-gerrit.com"
-
-            result = await main.get_circleci_status(
-                "99999", gerrit_base_url=gerrit_base_url
-            )
-
-            self.assertIn("Failed to fetch change details for CL 99999", result[0]["text"])
-
-        asyncio.run(run_test())
+SAMPLE_CHANGE_DETAIL_JSON = json.dumps(SAMPLE_CHANGE_DETAIL)
+SAMPLE_WORKFLOWS_JSON = json.dumps(SAMPLE_WORKFLOWS)
+EMPTY_WORKFLOWS_JSON = "[]"
+
+
+@patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
+class TestGetCircleciStatus(unittest.IsolatedAsyncioTestCase):
+    @staticmethod
+    def _curl_responses(status_response):
+        """Returns run_curl results for the change details, then status_response."""
+        return [SAMPLE_CHANGE_DETAIL_JSON, status_response]
+
+    async def test_mixed_workflow_statuses(self, mock_run_curl):
+        mock_run_curl.side_effect = self._curl_responses(SAMPLE_WORKFLOWS_JSON)
+        gerrit_base_url = "https://my-gerrit.com"
+
+        result = await main.get_circleci_status(
+            "11286", gerrit_base_url=gerrit_base_url
+        )
+
+        text = result[0]["text"]
+        self.assertIn("CircleCI Status for CL 11286", text)
+        self.assertIn("[FAILED] build-windows-app", text)
+        self.assertIn("[SUCCESS] build-linux-ebpf", text)
+        self.assertIn("[success] cargo fmt check", text)
+        self.assertIn("[failed] build-windows-amd64", text)
+        self.assertIn("[blocked] sign-windows-artifacts", text)
+        # Failed jobs should have URLs
+        self.assertIn("URL: https://app.circleci.com/pipelines/gh/wiz-sec/sensor/36754/workflows/", text)
+        # Summary
+        self.assertIn("1 failed", text)
+        self.assertIn("1 success", text)
+        self.assertIn("2 workflows", text)
+
+    async def test_job_duration_formatting(self, mock_run_curl):
+        mock_run_curl.side_effect = self._curl_responses(SAMPLE_WORKFLOWS_JSON)
+        gerrit_base_url = "https://my-gerrit.com"
+
+        result = await main.get_circleci_status(
+            "11286", gerrit_base_url=gerrit_base_url
+        )
+
+        text = result[0]["text"]
+        # cargo fmt check: 22:09:53 -> 22:10:21 = 28s
+        self.assertIn("(28s)", text)
+        # build-windows-amd64: 22:09:58 -> 22:21:39 = 11m41s
+        self.assertIn("(11m41s)", text)
+
+    async def test_empty_workflows(self, mock_run_curl):
+        mock_run_curl.side_effect = self._curl_responses(EMPTY_WORKFLOWS_JSON)
+        gerrit_base_url = "https://my-gerrit.com"
+
+        result = await main.get_circleci_status(
+            "11286", gerrit_base_url=gerrit_base_url
+        )
+
+        self.assertIn("No CircleCI workflows found for CL 11286", result[0]["text"])
+
+    async def test_plugin_not_installed(self, mock_run_curl):
+        mock_run_curl.side_effect = self._curl_responses(
+            Exception("curl command failed with exit code 1.\nSTDERR:\n404 Not Found")
+        )
+        gerrit_base_url = "https://my-gerrit.com"
+
+        result = await main.get_circleci_status(
+            "11286", gerrit_base_url=gerrit_base_url
+        )
+
+        self.assertIn("No CircleCI status endpoint found", result[0]["text"])
+        self.assertIn("CircleCI plugin may not be installed", result[0]["text"])
+
+    async def test_change_detail_fetch_failure(self, mock_run_curl):
+        mock_run_curl.side_effect = Exception(
+            "curl command failed with exit code 1.\nSTDERR:\nConnection refused"
+        )
+        gerrit_base_url = "https://my-gerrit.com"
+
+        result = await main.get_circleci_status(
+            "99999", gerrit_base_url=gerrit_base_url
+        )
+
+        self.assertIn("Failed to fetch change details for CL 99999", result[0]["text"])
+
+    async def test_triplet_change_id_fetches_status_concurrently(self, mock_run_curl):
+        mock_run_curl.side_effect = self._curl_responses(SAMPLE_WORKFLOWS_JSON)
+        gerrit_base_url = "https://my-gerrit.com"
+        change_id = "sensor~master~Ie9b66b1368ac166ae4d04d0dfbcaebb7f36af464"
+
+        result = await main.get_circleci_status(
+            change_id, gerrit_base_url=gerrit_base_url
+        )
+
+        self.assertIn("CircleCI Status for CL 11286", result[0]["text"])
+        self.assertEqual(mock_run_curl.call_count, 2)
+        self.assertEqual(
+            mock_run_curl.call_args_list[1].args[0],
+            [
+                "https://my-gerrit.com/plugins/circleci/status"
+                "?changeId=Ie9b66b1368ac166ae4d04d0dfbcaebb7f36af464"
+                "&branch=master&project=sensor"
+            ],
+        )
+
+    @patch("gerrit_mcp_server.main.get_circleci_status", new_callable=AsyncMock)
+    async def test_bulk_keeps_order_and_isolates_failures(
+        self, mock_get_status, mock_run_curl
+    ):
+        async def fake_status(change_id, gerrit_base_url=None):
+            if change_id == "2":
+                raise Exception("Connection refused")
+            return [{"type": "text", "text": f"CircleCI Status for CL {change_id}"}]
+
+        mock_get_status.side_effect = fake_status
+
+        result = await main.get_circleci_status_bulk(
+            ["1", "2", "3"], gerrit_base_url="https://my-gerrit.com"
+        )
+
+        texts = [content["text"] for content in result]
+        self.assertEqual(texts[0], "CircleCI Status for CL 1")
+        self.assertIn("Failed to fetch CircleCI status for CL 2", texts[1])
+        self.assertEqual(texts[2], "CircleCI Status for CL 3")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+from unittest.mock import patch
+
+from gerrit_mcp_server import json_utils
+
+
+class TestJsonUtils(unittest.TestCase):
+
+    def test_loads_accepts_str_and_bytes(self):
+        self.assertEqual(json_utils.loads('{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertEqual(json_utils.loads(b'{"a": [1, 2]}'), {"a": [1, 2]})
+
+    def test_dumps_is_compact(self):
+        self.assertEqual(json_utils.dumps({"a": [1, "é"]}), '{"a":[1,"é"]}')
+
+    def test_invalid_json_raises_stdlib_error(self):
+        with self.assertRaises(json.JSONDecodeError):
+            json_utils.loads("not json")
+
+    def test_stdlib_fallback_matches(self):
+        with patch.object(json_utils, "orjson", None):
+            self.assertEqual(json_utils.loads(b'{"a": 1}'), {"a": 1})
+            self.assertEqual(json_utils.dumps({"a": [1, "é"]}), '{"a":[1,"é"]}')
+            with self.assertRaises(json.JSONDecodeError):
+                json_utils.loads("not json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,111 +14,109 @@
 
 import unittest
 from unittest.mock import patch, AsyncMock
-import asyncio
 import json
 
 from gerrit_mcp_server import main
 
+UNRESOLVED_COMMENTS = {
+    "src/main.py": [
+        {
+            "id": "abc123",
+            "line": 10,
+            "author": {"name": "user1@example.com"},
+            "message": "This is a comment.",
+            "unresolved": True,
+            "updated": "2025-07-15T10:00:00Z",
+        },
+        {
+            "id": "def456",
+            "in_reply_to": "abc123",
+            "line": 15,
+            "author": {"name": "user2@example.com"},
+            "message": "This is resolved.",
+            "unresolved": False,
+            "updated": "2025-07-15T10:05:00Z",
+        },
+    ],
+    "README.md": [
+        {
+            "id": "ghi789",
+            "author": {"name": "user1@example.com"},
+            "message": "Another unresolved comment.",
+            "unresolved": True,
+            "updated": "2025-07-15T10:10:00Z",
+        }
+    ],
+}
 
-class TestListChangeComments(unittest.TestCase):
-    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
-    def test_list_change_comments_unresolved(self, mock_run_curl):
-        async def run_test():
-            # Arrange
-            change_id = "11223"
-            mock_response = {
-                "src/main.py": [
-                    {
-                        "id": "abc123",
-                        "line": 10,
-                        "author": {"name": "user1@example.com"},
-                        "message": "This is a comment.",
-                        "unresolved": True,
-                        "updated": "2025-07-15T10:00:00Z",
-                    },
-                    {
-                        "id": "def456",
-                        "in_reply_to": "abc123",
-                        "line": 15,
-                        "author": {"name": "user2@example.com"},
-                        "message": "This is resolved.",
-                        "unresolved": False,
-                        "updated": "2025-07-15T10:05:00Z",
-                    },
-                ],
-                "README.md": [
-                    {
-                        "id": "ghi789",
-                        "author": {"name": "user1@example.com"},
-                        "message": "Another unresolved comment.",
-                        "unresolved": True,
-                        "updated": "2025-07-15T10:10:00Z",
-                    }
-                ],
-            }
-            mock_run_curl.return_value = json.dumps(mock_response)
-            gerrit_base_url = "https://my-gerrit.com"
-
-            # Act
-            result = await main.list_change_comments(
-                change_id, gerrit_base_url=gerrit_base_url
-            )
+RESOLVED_COMMENTS = {
+    "src/main.py": [
+        {
+            "id": "xyz999",
+            "line": 15,
+            "author": {"name": "user2@example.com"},
+            "message": "This is resolved.",
+            "unresolved": False,
+            "updated": "2025-07-15T10:05:00Z",
+        }
+    ]
+}
 
-            # Assert
-            self.assertIn("Comments for CL 11223", result[0]["text"])
-            self.assertIn("File: src/main.py", result[0]["text"])
-            self.assertIn(
-                "L10 [id: abc123]: [user1@example.com] (2025-07-15T10:00:00Z) - UNRESOLVED",
-                result[0]["text"],
-            )
-            self.assertIn("This is a comment.", result[0]["text"])
-            self.assertIn(
-                "L15 [id: def456] (in_reply_to: abc123): [user2@example.com] (2025-07-15T10:05:00Z) - RESOLVED",
-                result[0]["text"],
-            )
-            self.assertIn("This is resolved.", result[0]["text"])
-            self.assertIn("File: README.md", result[0]["text"])
-            self.assertIn(
-                "LFile [id: ghi789]: [user1@example.com] (2025-07-15T10:10:00Z) - UNRESOLVED",
-                result[0]["text"],
-            )
-            self.assertIn("Another unresolved comment.", result[0]["text"])
+UNRESOLVED_COMMENTS_JSON = json.dumps(UNRESOLVED_COMMENTS)
+RESOLVED_COMMENTS_JSON = json.dumps(RESOLVED_COMMENTS)
 
-        asyncio.run(run_test())
 
+class TestListChangeComments(unittest.IsolatedAsyncioTestCase):
     @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
-    def test_list_change_comments_none_unresolved(self, mock_run_curl):
-        async def run_test():
-            # Arrange
-            change_id = "11223"
-            mock_response = {
-                "src/main.py": [
-                    {
-                        "id": "xyz999",
-                        "line": 15,
-                        "author": {"name": "user2@example.com"},
-                        "message": "This is resolved.",
-                        "unresolved": False,
-                        "updated": "2025-07-15T10:05:00Z",
-                    }
-                ]
-            }
-            mock_run_curl.return_value = json.dumps(mock_response)
-            gerrit_base_url = "https://my-gerrit.com"
+    async def test_list_change_comments_unresolved(self, mock_run_curl):
+        # Arrange
+        change_id = "11223"
+        mock_run_curl.return_value = UNRESOLVED_COMMENTS_JSON
+        gerrit_base_url = "https://my-gerrit.com"
+
+        # Act
+        result = await main.list_change_comments(
+            change_id, gerrit_base_url=gerrit_base_url
+        )
 
-            # Act
-            result = await main.list_change_comments(
-                change_id, gerrit_base_url=gerrit_base_url
-            )
+        # Assert
+        self.assertIn("Comments for CL 11223", result[0]["text"])
+        self.assertIn("File: src/main.py", result[0]["text"])
+        self.assertIn(
+            "L10 [id: abc123]: [user1@example.com] (2025-07-15T10:00:00Z) - UNRESOLVED",
+            result[0]["text"],
+        )
+        self.assertIn("This is a comment.", result[0]["text"])
+        self.assertIn(
+            "L15 [id: def456] (in_reply_to: abc123): [user2@example.com] (2025-07-15T10:05:00Z) - RESOLVED",
+            result[0]["text"],
+        )
+        self.assertIn("This is resolved.", result[0]["text"])
+        self.assertIn("File: README.md", result[0]["text"])
+        self.assertIn(
+            "LFile [id: ghi789]: [user1@example.com] (2025-07-15T10:10:00Z) - UNRESOLVED",
+            result[0]["text"],
+        )
+        self.assertIn("Another unresolved comment.", result[0]["text"])
+
+    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
+    async def test_list_change_comments_none_unresolved(self, mock_run_curl):
+        # Arrange
+        change_id = "11223"
+        mock_run_curl.return_value = RESOLVED_COMMENTS_JSON
+        gerrit_base_url = "https://my-gerrit.com"
 
-            # Assert
-            self.assertIn("Comments for CL 11223", result[0]["text"])
-            self.assertIn(
-                "L15 [id: xyz999]: [user2@example.com] (2025-07-15T10:05:00Z) - RESOLVED",
-                result[0]["text"],
-            )
+        # Act
+        result = await main.list_change_comments(
+            change_id, gerrit_base_url=gerrit_base_url
+        )
 
-        asyncio.run(run_test())
+        # Assert
+        self.assertIn("Comments for CL 11223", result[0]["text"])
+        self.assertIn(
+            "L15 [id: xyz999]: [user2@example.com] (2025-07-15T10:05:00Z) - RESOLVED",
+            result[0]["text"],
+        )
 
 
 if __name__ == "__main__":
@@ -14,8 +14,10 @@
 
 import pytest
 import asyncio
+import base64
 import os
 import json
+import httpx
 from unittest.mock import patch, AsyncMock
 from gerrit_mcp_server import main
 
@@ -92,6 +94,37 @@ def test_load_gerrit_config_with_env_var():
             config = main.load_gerrit_config()
             assert config == {"key": "value"}
 
+def test_load_gerrit_config_is_cached_until_modified(tmp_path):
+    """Tests that the configuration is only re-read after the file changes."""
+    config_file = tmp_path / "gerrit_config.json"
+    config_file.write_text('{"key": "value"}')
+    with patch.dict(os.environ, {"GERRIT_CONFIG_PATH": str(config_file)}):
+        first = main.load_gerrit_config()
+        assert main.load_gerrit_config() is first
+
+        config_file.write_text('{"key": "changed"}')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert main.load_gerrit_config() == {"key": "changed"}
+
+def test_load_gerrit_config_validates_default_url(tmp_path):
+    """Tests that the default URL must match one of the configured hosts."""
+    hosts = [{"internal_url": "http://gerrit.internal/", "external_url": "https://gerrit.example.com"}]
+    config_file = tmp_path / "gerrit_config.json"
+    with patch.dict(os.environ, {"GERRIT_CONFIG_PATH": str(config_file)}):
+        config_file.write_text(
+            json.dumps({"default_gerrit_base_url": "gerrit.internal", "gerrit_hosts": hosts})
+        )
+        assert main.load_gerrit_config()["default_gerrit_base_url"] == "gerrit.internal"
+
+        config_file.write_text(
+            json.dumps({"default_gerrit_base_url": "https://other.com", "gerrit_hosts": hosts})
+        )
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with pytest.raises(ValueError, match="does not match any"):
+            main.load_gerrit_config()
+
 def test_get_gerrit_base_url_with_no_env_var(mock_load_config):
     """Tests that the default base URL is used when no environment variable is set."""
     with patch.dict(os.environ, {}, clear=True):
@@ -149,6 +182,65 @@ async def test_run_curl_removes_gerrit_prefix(mock_exec, mock_load_config):
     result = await main.run_curl(["https://example.com"], "https://example.com")
     assert result == '{"key": "value"}'
 
+@pytest.mark.asyncio
+async def test_run_curl_http_basic_uses_http_client(mock_exec, mock_load_config):
+    """Tests that curl-authenticated hosts are requested over the shared HTTP client."""
+    mock_load_config.return_value = {
+        "gerrit_hosts": [{
+            "external_url": "https://example.com",
+            "authentication": {"type": "http_basic", "username": "user", "auth_token": "token"},
+        }]
+    }
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=b')]}\'\n{"key": "value"}')
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("gerrit_mcp_server.main._get_http_client", return_value=client):
+        args = main._create_post_args("https://example.com/a/changes/1/abandon", {"message": "m"})
+        result = await main.run_curl(args, "https://example.com")
+
+    assert result == '{"key": "value"}'
+    mock_exec.assert_not_called()
+    request = requests[0]
+    assert request.method == "POST"
+    assert str(request.url) == "https://example.com/a/changes/1/abandon"
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.headers["Authorization"] == "Basic " + base64.b64encode(b"user:token").decode()
+    assert json.loads(request.content) == {"message": "m"}
+
+@pytest.mark.asyncio
+async def test_run_curl_http_transport_error(mock_load_config):
+    """Tests that a transport failure on the HTTP client raises an exception."""
+    mock_load_config.return_value = {
+        "gerrit_hosts": [{
+            "external_url": "https://example.com",
+            "authentication": {"type": "http_basic", "username": "user", "auth_token": "token"},
+        }]
+    }
+
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("gerrit_mcp_server.main._get_http_client", return_value=client):
+        with pytest.raises(Exception, match="HTTP request to https://example.com failed"):
+            await main.run_curl(["https://example.com"], "https://example.com")
+
+@pytest.mark.asyncio
+async def test_http_client_closed_after_last_session():
+    """Tests that the shared HTTP client outlives all but the last session."""
+    with patch("gerrit_mcp_server.main._http_client", None):
+        async with main._http_client_lifespan(main.mcp):
+            async with main._http_client_lifespan(main.mcp):
+                client = main._get_http_client()
+            assert not client.is_closed
+            assert main._get_http_client() is client
+        assert client.is_closed
+        assert main._http_client is None
+
 @pytest.mark.asyncio
 async def test_get_bugs_from_cl_with_one_bug(mock_run_curl):
     """Tests extracting a single bug ID from a CL message."""
@@ -209,6 +301,13 @@ async def test_post_review_comment_failure(mock_run_curl):
     result = await main.post_review_comment("123", "file.py", 10, "test comment")
     assert "Failed to post comment" in result[0]["text"]
 
+@pytest.mark.asyncio
+async def test_post_review_comment_plain_text_error(mock_run_curl):
+    """Tests that a non-JSON error body from Gerrit is reported as a failure."""
+    mock_run_curl.return_value = "line 10 is not in the file"
+    result = await main.post_review_comment("123", "file.py", 10, "test comment")
+    assert "Failed to post comment. Response: line 10 is not in the file" in result[0]["text"]
+
 # --- Edge Case Tests ---
 
 @pytest.mark.asyncio
@@ -1,64 +1,54 @@
 import unittest
 from unittest.mock import patch, MagicMock
-import asyncio
 
 from gerrit_mcp_server.main import post_review_comment
 
+EXPECTED_LABELS_PAYLOAD = '{"comments":{"test.py":[{"line":1,"message":"test comment","unresolved":true}]},"labels":{"Verified":1}}'
+EXPECTED_REPLY_PAYLOAD = '{"comments":{"test.py":[{"line":1,"message":"reply comment","unresolved":true,"in_reply_to":"abc123"}]}}'
 
-class TestPostReviewComment(unittest.TestCase):
-    @patch("gerrit_mcp_server.main.run_curl")
-    def test_post_review_comment_with_labels(self, mock_run_curl):
-        mock_run_curl.return_value = (0, '{"done": true}', "")
-        asyncio.run(
-            post_review_comment(
-                "123",
-                "test.py",
-                1,
-                "test comment",
-                labels={"Verified": 1},
-                gerrit_base_url="https://gerrit-review.googlesource.com",
-            )
-        )
-        expected_payload_str = '{"comments": {"test.py": [{"line": 1, "message": "test comment", "unresolved": true}]}, "labels": {"Verified": 1}}'
-        mock_run_curl.assert_called_with(
+
+class TestPostReviewComment(unittest.IsolatedAsyncioTestCase):
+    @staticmethod
+    def _review_call(payload):
+        """Returns the run_curl arguments for posting payload to CL 123."""
+        return (
             [
                 "-X",
                 "POST",
                 "-H",
                 "Content-Type: application/json",
                 "--data",
-                expected_payload_str,
+                payload,
                 "https://gerrit-review.googlesource.com/changes/123/revisions/current/review",
             ],
             "https://gerrit-review.googlesource.com",
         )
 
     @patch("gerrit_mcp_server.main.run_curl")
-    def test_post_review_comment_with_in_reply_to(self, mock_run_curl):
-        mock_run_curl.return_value = (0, '{"done": true}', "")
-        asyncio.run(
-            post_review_comment(
-                "123",
-                "test.py",
-                1,
-                "reply comment",
-                in_reply_to="abc123",
-                gerrit_base_url="https://gerrit-review.googlesource.com",
-            )
+    async def test_post_review_comment_with_labels(self, mock_run_curl):
+        mock_run_curl.return_value = '{"labels": {"Verified": 1}}'
+        await post_review_comment(
+            "123",
+            "test.py",
+            1,
+            "test comment",
+            labels={"Verified": 1},
+            gerrit_base_url="https://gerrit-review.googlesource.com",
         )
-        expected_payload_str = '{"comments": {"test.py": [{"line": 1, "message": "reply comment", "unresolved": true, "in_reply_to": "abc123"}]}}'
-        mock_run_curl.assert_called_with(
-            [
-                "-X",
-                "POST",
-                "-H",
-                "Content-Type: application/json",
-                "--data",
-                expected_payload_str,
-                "https://gerrit-review.googlesource.com/changes/123/revisions/current/review",
-            ],
-            "https://gerrit-review.googlesource.com",
+        mock_run_curl.assert_called_with(*self._review_call(EXPECTED_LABELS_PAYLOAD))
+
+    @patch("gerrit_mcp_server.main.run_curl")
+    async def test_post_review_comment_with_in_reply_to(self, mock_run_curl):
+        mock_run_curl.return_value = "{}"
+        await post_review_comment(
+            "123",
+            "test.py",
+            1,
+            "reply comment",
+            in_reply_to="abc123",
+            gerrit_base_url="https://gerrit-review.googlesource.com",
         )
+        mock_run_curl.assert_called_with(*self._review_call(EXPECTED_REPLY_PAYLOAD))
 
 
 if __name__ == "__main__":
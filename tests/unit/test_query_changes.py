@@ -74,6 +74,66 @@ class TestQueryChanges(unittest.TestCase):
 
         asyncio.run(run_test())
 
+    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
+    def test_query_changes_url(self, mock_run_curl):
+        async def run_test():
+            # Arrange
+            mock_run_curl.return_value = "[]"
+            gerrit_base_url = "https://my-gerrit.com"
+
+            # Act
+            await main.query_changes(
+                "status:open label:Code-Review+2",
+                gerrit_base_url=gerrit_base_url,
+                limit=5,
+                options=["LABELS", "CURRENT_REVISION"],
+            )
+
+            # Assert
+            mock_run_curl.assert_called_once_with(
+                [
+                    "https://my-gerrit.com/changes/?q=status:open%20label:Code-Review%2B2"
+                    "&n=5&o=LABELS&o=CURRENT_REVISION"
+                ],
+                gerrit_base_url,
+            )
+
+        asyncio.run(run_test())
+
+    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
+    def test_query_changes_by_date_and_filters(self, mock_run_curl):
+        async def run_test():
+            # Arrange
+            mock_run_curl.return_value = "[]"
+            gerrit_base_url = "https://my-gerrit.com"
+
+            # Act
+            await main.query_changes_by_date_and_filters(
+                "2025-08-18", "2025-08-31", gerrit_base_url=gerrit_base_url
+            )
+
+            # Assert
+            url = mock_run_curl.call_args[0][0][0]
+            self.assertIn(
+                "q=status:merged%20after:2025-08-18%20before:2025-09-01", url
+            )
+
+        asyncio.run(run_test())
+
+    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
+    def test_query_changes_by_date_and_filters_invalid_date(self, mock_run_curl):
+        async def run_test():
+            # Act
+            result = await main.query_changes_by_date_and_filters(
+                "2025-13-01", "2025-08-31", gerrit_base_url="https://my-gerrit.com"
+            )
+
+            # Assert
+            self.assertIn("Invalid date format", result[0]["text"])
+            mock_run_curl.assert_not_called()
+
+        asyncio.run(run_test())
+
 
 if __name__ == "__main__":
     unittest.main()
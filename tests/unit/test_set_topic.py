@@ -40,7 +40,7 @@ class TestSetTopic(unittest.TestCase):
                 f"Successfully set topic for CL {change_id} to: {topic}",
                 result[0]["text"],
             )
-            payload = json.dumps({"topic": topic})
+            payload = json.dumps({"topic": topic}, separators=(",", ":"))
             expected_args = [
                 "-X",
                 "PUT",
@@ -86,8 +86,7 @@ class TestSetTopic(unittest.TestCase):
             # Arrange
             change_id = "12345"
             error_message = "topic not found"
-            # First call raises the error, second call returns the raw text for the error message
-            mock_run_curl.side_effect = [json.JSONDecodeError("", "", 0), error_message]
+            mock_run_curl.return_value = error_message
             gerrit_base_url = "https://my-gerrit.com"
 
             # Act
@@ -98,6 +97,8 @@ class TestSetTopic(unittest.TestCase):
             # Assert
             self.assertIn(f"Failed to set topic for CL {change_id}", result[0]["text"])
             self.assertIn(error_message, result[0]["text"])
+            # The PUT is not replayed to recover the raw response
+            mock_run_curl.assert_called_once()
 
         asyncio.run(run_test())
 
@@ -66,7 +66,7 @@ class TestSetWorkInProgress(unittest.TestCase):
 
             # Assert
             expected_url = "https://my-gerrit.com/changes/12345/wip"
-            expected_payload = json.dumps({"message": message})
+            expected_payload = json.dumps({"message": message}, separators=(",", ":"))
             expected_args = [
                 "-X",
                 "POST",
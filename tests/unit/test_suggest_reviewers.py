@@ -92,6 +92,34 @@ class TestSuggestReviewers(unittest.TestCase):
 
         asyncio.run(run_test())
 
+    @patch("gerrit_mcp_server.main.run_curl", new_callable=AsyncMock)
+    def test_suggest_reviewers_url(self, mock_run_curl):
+        async def run_test():
+            # Arrange
+            mock_run_curl.return_value = "[]"
+            gerrit_base_url = "https://my-gerrit.com"
+
+            # Act
+            await main.suggest_reviewers(
+                "12345",
+                "John Doe",
+                limit=5,
+                exclude_groups=True,
+                reviewer_state="CC",
+                gerrit_base_url=gerrit_base_url,
+            )
+
+            # Assert
+            mock_run_curl.assert_called_once_with(
+                [
+                    "https://my-gerrit.com/changes/12345/suggest_reviewers"
+                    "?q=John%20Doe&n=5&reviewer-state=CC&exclude-groups"
+                ],
+                gerrit_base_url,
+            )
+
+        asyncio.run(run_test())
+
 
 if __name__ == "__main__":
     unittest.main()